@@ -1,12 +1,11 @@
 import logging
 import os
-import time
-
-from tqdm import tqdm
 
 from src.db_manager import DBManager
-from src.external_api import HeadHunterAPI
-from src.utils import parse_employers, parse_vacancies
+from src.history import HISTORY_MODE, VacancyHistoryManager
+from src.renderer import ResultPager
+from src.search_index import SEARCH_INDEX_MODE, VacancySearchIndex
+from src.sources import SourceRegistry, load_source_settings
 
 log_dir = "logs"
 os.makedirs(log_dir, exist_ok=True)
@@ -28,22 +27,18 @@ def main() -> None:
     try:
         logger.info("Начало работы приложения.")
         print("🔎 Добро пожаловать в систему поиска вакансий!")
-        time.sleep(0.5)
 
-        # Получение данных с API
-        logger.info("Получение данных от API HeadHunter")
+        # Получение данных из источников
+        logger.info("Получение данных из источников вакансий")
         print("\n🔄 Получаем данные о вакансиях...")
 
-        api = HeadHunterAPI()
-        employers_data = api.get_employers()
-        vacancies_data = []
-        for employer in tqdm(employers_data, desc="Получение данных о вакансиях"):
-            vacancies_data.extend(api.get_vacancies(int(employer.get("id"))))
-
-        # Преобразовываем полученные данные
-        logger.info("Обработка полученных данных.")
-        employers = parse_employers(employers_data)
-        vacancies = parse_vacancies(vacancies_data)
+        with SourceRegistry.from_settings(load_source_settings()) as registry:
+            employers, vacancies, stats = registry.fetch()
+        for source, stat in stats.items():
+            print(
+                f"➢ {source}: {stat['vacancies']} вакансий за {stat['seconds']} с "
+                f"({stat['vacancies_per_second']} вакансий/с)"
+            )
 
         # Инициализация базы данных
         logger.info("Инициализация базы данных")
@@ -54,8 +49,20 @@ def main() -> None:
         db_manager.insert_employers(employers)
         db_manager.insert_vacancies(vacancies)
 
+        if HISTORY_MODE:
+            logger.info("Сохранение снимка вакансий в историю.")
+            history = VacancyHistoryManager(db_manager)
+            history.create_tables()
+            history.record_snapshot(vacancies)
+            history.apply_retention()
+
+        search_index = None
+        if SEARCH_INDEX_MODE:
+            # Индекс строится по БД, а не по данным этого запуска: в ней есть и вакансии прошлых загрузок
+            logger.info("Построение поискового индекса вакансий.")
+            search_index = VacancySearchIndex.from_db(db_manager)
+
         print("✅  Данные успешно загружены!")
-        time.sleep(0.5)
 
         # Пользовательский интерфейс
         while True:
@@ -69,7 +76,6 @@ def main() -> None:
 
             logger.info("Пользователь выбирает действие в меню управления вакансиями.")
             user_choice = input("Выберите действие: ").strip()
-            time.sleep(0.5)
             logger.info(f"Пользователь ввёл: {user_choice}.")
 
             if user_choice == "1":
@@ -78,77 +84,34 @@ def main() -> None:
                     print(f"➢ {company[0]}: {company[1]} вакансий.")
             elif user_choice == "2":
                 print("\nСписок вакансий:")
-                for vacancy in db_manager.get_all_vacancies():
-                    if vacancy[2] and vacancy[3]:
-                        if vacancy[2] == vacancy[3] and vacancy[2] > 0:
-                            salary_text = f"{vacancy[2]} ₽"
-                        else:
-                            salary_text = f"{vacancy[2]} — {vacancy[3]} ₽"
-                    elif vacancy[2] and vacancy[2] > 0:
-                        salary_text = f"от {vacancy[2]} ₽"
-                    elif vacancy[3] and vacancy[3] > 0:
-                        salary_text = f"до {vacancy[3]} ₽"
-                    else:
-                        salary_text = "Зарплата не указана"
-                    print(f"➢ {vacancy[1]} | Компания: {vacancy[0]} | {salary_text} | {vacancy[4]}")
+                ResultPager.from_query(db_manager, db_manager.all_vacancies_query()).browse()
             elif user_choice == "3":
                 avg = db_manager.get_avg_salary()
                 print(f"\n➢ Средняя зарплата по вакансиям: {avg} руб.")
             elif user_choice == "4":
                 print("\nВакансии с зарплатой выше средней:")
-                for vacancy in db_manager.get_vacancies_with_higher_salary():
-                    if vacancy[2] and vacancy[3]:
-                        if vacancy[2] == vacancy[3] and vacancy[2] > 0:
-                            salary_text = f"{vacancy[2]} ₽"
-                        else:
-                            salary_text = f"{vacancy[2]} — {vacancy[3]} ₽"
-                    elif vacancy[2] and vacancy[2] > 0:
-                        salary_text = f"от {vacancy[2]} ₽"
-                    elif vacancy[3] and vacancy[3] > 0:
-                        salary_text = f"до {vacancy[3]} ₽"
-                    else:
-                        salary_text = "Зарплата не указана"
-                    print(f"➢ {vacancy[1]} | Компания: {vacancy[0]} | {salary_text} | {vacancy[4]}")
+                ResultPager.from_query(db_manager, db_manager.higher_salary_query()).browse()
             elif user_choice == "5":
                 while True:
                     keywords = input("\nВведите ключевые слова через пробел: ").strip().split()
-                    time.sleep(0.5)
                     if keywords:
-                        vacancies = db_manager.get_vacancies_with_keyword(keywords)
-                        print(f"\nНайдено {len(vacancies)} вакансий по запросу '{keywords}':")
-                        time.sleep(1)
-                        if vacancies:
-                            for vacancy in vacancies:
-                                if vacancy[2] and vacancy[3]:
-                                    if vacancy[2] == vacancy[3] and vacancy[2] > 0:
-                                        salary_text = f"{vacancy[2]} ₽"
-                                    else:
-                                        salary_text = f"{vacancy[2]} — {vacancy[3]} ₽"
-                                elif vacancy[2] and vacancy[2] > 0:
-                                    salary_text = f"от {vacancy[2]} ₽"
-                                elif vacancy[3] and vacancy[3] > 0:
-                                    salary_text = f"до {vacancy[3]} ₽"
-                                else:
-                                    salary_text = "Зарплата не указана"
-                                print(f"➢ {vacancy[1]} | Компания: {vacancy[0]} | {salary_text} | {vacancy[4]}")
-                            break
+                        if search_index is not None:
+                            pager = ResultPager.from_rows(search_index.get_vacancies_with_keyword(keywords))
                         else:
-                            print("\n⚠️ По вашему запросу ничего не найдено.")
-                            time.sleep(0.5)
-                            break
+                            pager = ResultPager.from_query(db_manager, db_manager.keyword_query(keywords))
+                        print(f"\nВакансии по запросу '{keywords}':")
+                        pager.browse()
+                        break
                     else:
                         logger.info("Пользователь не ввёл слова для поиска. Пользователю предложено повторить ввод.")
                         print("⚠️ Пожалуйста, введите ключевые слова для поиска.")
-                        time.sleep(0.5)
 
             elif user_choice == "0":
                 print("\n👋🏻 Выход из программы.")
-                time.sleep(0.5)
                 break
             else:
                 logger.info(f"Некорректный ответ: {user_choice}. Пользователю предложено повторить ввод.")
                 print("⚠️ Некорректный ответ. Повторите ввод.")
-                time.sleep(0.5)
 
     except Exception as e:
         logger.error(f"Произошла ошибка при работе программы: {e}.", exc_info=True)
@@ -1,10 +1,21 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from src.models import Employer, Vacancy
+from src.utils import parse_employers, parse_vacancies
+
+if TYPE_CHECKING:
+    from src.sources import RateLimiter
 
 
 class VacancyAPI(ABC):
     """Абстрактный класс для работы с API сервиса вакансий."""
 
+    # Код источника: входит в идентификатор работодателей и вакансий в БД (source, id)
+    source: str = ""
+    # Ограничитель частоты запросов, назначается реестром источников
+    rate_limiter: Optional["RateLimiter"] = None
+
     @abstractmethod
     def _connect(self) -> None:
         """Абстрактный метод для отправки запроса на базовый URL и проверки статус-кода."""
@@ -24,3 +35,30 @@ class VacancyAPI(ABC):
         :return: Список словарей с информацией о вакансиях.
         """
         pass
+
+    def close(self) -> None:
+        """Метод для освобождения ресурсов клиента. По умолчанию ресурсов нет."""
+        pass
+
+    def _throttle(self) -> None:
+        """Метод для ожидания разрешения ограничителя частоты перед отправкой запроса."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+    def normalize_employers(self, employers_data: List[Dict]) -> List[Employer]:
+        """
+        Метод для приведения данных работодателей к общей схеме. По умолчанию ожидается формат hh.ru.
+
+        :param employers_data: Список словарей с данными работодателей из API.
+        :return: Список объектов работодателей.
+        """
+        return parse_employers(employers_data, self.source)
+
+    def normalize_vacancies(self, vacancies_data: List[Dict]) -> List[Vacancy]:
+        """
+        Метод для приведения данных вакансий к общей схеме. По умолчанию ожидается формат hh.ru.
+
+        :param vacancies_data: Список словарей с данными вакансий из API.
+        :return: Список объектов вакансий.
+        """
+        return parse_vacancies(vacancies_data, self.source)
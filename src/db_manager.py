@@ -1,11 +1,13 @@
 import os
-from typing import List, Tuple
+import uuid
+from typing import Iterator, List, NamedTuple, Optional, Tuple
 
 import psycopg2
 from dotenv import load_dotenv
+from psycopg2.extensions import cursor
 
 from src.logger_config import add_logger
-from src.models import Employer, Vacancy
+from src.models import DEFAULT_SOURCE, Employer, Vacancy
 
 # Загрузка переменных окружения
 load_dotenv()
@@ -18,6 +20,107 @@ DATABASE_PORT = os.getenv("DATABASE_PORT")
 # Настройка логирования
 logger = add_logger("db_manager.log", "db_manager")
 
+# Столбцы и таблицы отчетов по вакансиям (компания, название, зарплата от, зарплата до, ссылка)
+REPORT_COLUMNS = "e.name, v.title, v.salary_from, v.salary_to, v.url"
+REPORT_TABLES = "vacancies v JOIN employers e USING (source, emp_id)"
+MAX_INTEGER = 2147483647
+
+
+class PagedQuery(NamedTuple):
+    """
+    Запрос отчета с постраничным чтением по ключу (keyset pagination).
+
+    Последние столбцы `order_by` должны однозначно определять строку, а сами столбцы — не содержать NULL:
+    следующая страница выбирается условием `(order_by) > (ключ последней строки)`.
+    """
+
+    columns: str
+    tables: str
+    where: str
+    params: Tuple
+    order_by: Tuple[str, ...]
+    descending: bool = False
+
+    def __where(self, conditions: List[str]) -> str:
+        """Возвращает предложение WHERE из условия запроса и дополнительных условий."""
+        conditions = ([f"({self.where})"] if self.where else []) + conditions
+        return f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    def __order(self) -> str:
+        """Возвращает выражение ORDER BY."""
+        direction = " DESC" if self.descending else ""
+        return ", ".join(f"{column}{direction}" for column in self.order_by)
+
+    def sql(self) -> Tuple[str, Tuple]:
+        """Метод для получения полного запроса в виде (SQL, параметры)."""
+        return f"SELECT {self.columns} FROM {self.tables} {self.__where([])} ORDER BY {self.__order()};", self.params
+
+    def count_sql(self) -> Tuple[str, Tuple]:
+        """Метод для получения запроса количества строк в виде (SQL, параметры)."""
+        return f"SELECT COUNT(*) FROM {self.tables} {self.__where([])};", self.params
+
+    def page_sql(self, limit: int, after: Optional[Tuple] = None) -> Tuple[str, Tuple]:
+        """
+        Метод для получения запроса страницы в виде (SQL, параметры). К строкам добавляются столбцы ключа.
+
+        :param limit: Количество строк.
+        :param after: Ключ последней строки предыдущей страницы (None — первая страница).
+        :return: Кортеж (SQL-запрос, параметры).
+        """
+        conditions, params = [], self.params
+        if after is not None:
+            operator = "<" if self.descending else ">"
+            placeholders = ", ".join(["%s"] * len(self.order_by))
+            conditions.append(f"({', '.join(self.order_by)}) {operator} ({placeholders})")
+            params += tuple(after)
+        return (
+            f"SELECT {self.columns}, {', '.join(self.order_by)} FROM {self.tables} {self.__where(conditions)} "
+            f"ORDER BY {self.__order()} LIMIT %s;",
+            params + (limit,),
+        )
+
+
+def constraints_without_source(cur: cursor, table: str, constraint_type: str) -> List[str]:
+    """
+    Функция для получения ограничений таблицы, в которые не входит столбец source.
+
+    :param cur: Курсор БД.
+    :param table: Название таблицы.
+    :param constraint_type: Тип ограничения: 'p' — первичный ключ, 'f' — внешний ключ.
+    :return: Список названий ограничений.
+    """
+    cur.execute(
+        """
+        SELECT c.conname
+        FROM pg_constraint c
+        WHERE c.conrelid = %s::regclass AND c.contype = %s
+            AND NOT EXISTS (
+                SELECT 1 FROM pg_attribute a
+                WHERE a.attrelid = c.conrelid AND a.attnum = ANY(c.conkey) AND a.attname = 'source'
+            );
+        """,
+        (table, constraint_type),
+    )
+    return [row[0] for row in cur.fetchall()]
+
+
+def migrate_source_key(cur: cursor, table: str, primary_key: Tuple[str, ...]) -> None:
+    """
+    Функция для перевода таблицы, созданной без столбца source, на ключ с кодом источника.
+
+    Добавляет столбец source (существующие строки относятся к hh.ru) и заменяет первичный ключ,
+    если source в него еще не входит. Повторный вызов ничего не меняет.
+
+    :param cur: Курсор БД.
+    :param table: Название таблицы.
+    :param primary_key: Столбцы нового первичного ключа.
+    """
+    cur.execute(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS source TEXT NOT NULL DEFAULT '{DEFAULT_SOURCE}';")
+    for name in constraints_without_source(cur, table, "p"):
+        cur.execute(f"ALTER TABLE {table} DROP CONSTRAINT {name};")
+        cur.execute(f"ALTER TABLE {table} ADD PRIMARY KEY ({', '.join(primary_key)});")
+        logger.info(f"Первичный ключ таблицы '{table}' заменен на ({', '.join(primary_key)}).")
+
 
 class DBManager:
     """Класс для управления подключением и операциями с БД."""
@@ -42,26 +145,50 @@ class DBManager:
                 cur.execute(
                     """
                     CREATE TABLE IF NOT EXISTS employers (
-	                    emp_id INTEGER PRIMARY KEY,
+                        source TEXT NOT NULL DEFAULT 'hh',
+	                    emp_id INTEGER NOT NULL,
 	                    name TEXT NOT NULL, 
 	                    vac_count INTEGER, 
-	                    url TEXT
+	                    url TEXT,
+                        PRIMARY KEY (source, emp_id)
                     );
                     """
                 )
                 cur.execute(
                     """
                     CREATE TABLE IF NOT EXISTS vacancies (
-                        vac_id INTEGER PRIMARY KEY,
+                        source TEXT NOT NULL DEFAULT 'hh',
+                        vac_id INTEGER NOT NULL,
                         title TEXT NOT NULL,
                         salary_from INTEGER,
                         salary_to INTEGER,
                         city TEXT,
                         url TEXT,
-                        emp_id INTEGER REFERENCES employers(emp_id) ON DELETE CASCADE
+                        emp_id INTEGER,
+                        PRIMARY KEY (source, vac_id),
+                        CONSTRAINT vacancies_source_emp_id_fkey
+                            FOREIGN KEY (source, emp_id) REFERENCES employers(source, emp_id) ON DELETE CASCADE
                     );
                     """
                 )
+                # Таблицы предыдущих версий (без source): внешний ключ по emp_id мешает заменить ключ employers
+                for name in constraints_without_source(cur, "vacancies", "f"):
+                    cur.execute(f"ALTER TABLE vacancies DROP CONSTRAINT {name};")
+                migrate_source_key(cur, "employers", ("source", "emp_id"))
+                migrate_source_key(cur, "vacancies", ("source", "vac_id"))
+                cur.execute(
+                    """
+                    SELECT 1 FROM pg_constraint
+                    WHERE conrelid = 'vacancies'::regclass AND conname = 'vacancies_source_emp_id_fkey';
+                    """
+                )
+                if cur.fetchone() is None:
+                    cur.execute(
+                        """
+                        ALTER TABLE vacancies ADD CONSTRAINT vacancies_source_emp_id_fkey
+                        FOREIGN KEY (source, emp_id) REFERENCES employers(source, emp_id) ON DELETE CASCADE;
+                        """
+                    )
                 logger.info("Таблицы employers и vacancies созданы успешно.")
 
     def close_conn(self) -> None:
@@ -80,10 +207,10 @@ class DBManager:
             with self.conn.cursor() as cur:
                 cur.executemany(
                     """
-                    INSERT INTO employers(emp_id, name, vac_count, url) VALUES (%s, %s, %s, %s)
-                    ON CONFLICT (emp_id) DO NOTHING;
+                    INSERT INTO employers(source, emp_id, name, vac_count, url) VALUES (%s, %s, %s, %s, %s)
+                    ON CONFLICT (source, emp_id) DO NOTHING;
                     """,
-                    [(emp.emp_id, emp.name, emp.vac_count, emp.url) for emp in employers],
+                    [(emp.source, emp.emp_id, emp.name, emp.vac_count, emp.url) for emp in employers],
                 )
         logger.info("Работодатели успешно добавлены.")
 
@@ -98,17 +225,51 @@ class DBManager:
             with self.conn.cursor() as cur:
                 cur.executemany(
                     """
-                    INSERT INTO vacancies(vac_id, title, salary_from, salary_to, emp_id, city, url)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (vac_id) DO NOTHING;
+                    INSERT INTO vacancies(source, vac_id, title, salary_from, salary_to, emp_id, city, url)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                    ON CONFLICT (source, vac_id) DO NOTHING;
                     """,
                     [
-                        (vac.vac_id, vac.title, vac.salary_from, vac.salary_to, vac.emp_id, vac.city, vac.url)
+                        (
+                            vac.source,
+                            vac.vac_id,
+                            vac.title,
+                            vac.salary_from,
+                            vac.salary_to,
+                            vac.emp_id,
+                            vac.city,
+                            vac.url,
+                        )
                         for vac in vacancies
                     ],
                 )
         logger.info("Вакансии успешно добавлены.")
 
+    def stream_rows(self, query: str, batch_size: int = 10000) -> Iterator[List[Tuple]]:
+        """
+        Метод для потокового чтения результата запроса через серверный (именованный) курсор.
+
+        В отличие от `fetchall()` строки передаются с сервера пачками по `batch_size`,
+        поэтому потребление памяти не зависит от размера таблицы.
+
+        :param query: SQL-запрос без параметров.
+        :param batch_size: Количество строк в одной пачке.
+        :return: Итератор по пачкам строк.
+        """
+        logger.info(f"Запущен метод 'stream_rows' в классе '{type(self).__name__}'. Размер пачки: '{batch_size}'.")
+        total = 0
+        with self.conn:
+            with self.conn.cursor(name=f"stream_{uuid.uuid4().hex}") as cur:
+                cur.itersize = batch_size
+                cur.execute(query)
+                while True:
+                    rows = cur.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    total += len(rows)
+                    yield rows
+        logger.info(f"Потоковое чтение завершено. Всего получено строк: '{total}'.")
+
     def get_companies_and_vacancies_count(self) -> List[Tuple]:
         """Метод для получения списка всех компаний и количество вакансий у каждой компании."""
         logger.info(f"Запущен метод 'get_companies_and_vacancies_count' в классе '{type(self).__name__}'.")
@@ -118,7 +279,7 @@ class DBManager:
                     """
                     SELECT e.name, COUNT(v.vac_id) as vacancy_count 
                     FROM employers e
-                    LEFT JOIN vacancies v USING (emp_id)
+                    LEFT JOIN vacancies v USING (source, emp_id)
                     GROUP BY e.name
                     ORDER BY vacancy_count;
                     """
@@ -127,19 +288,97 @@ class DBManager:
                 logger.info("Список компаний и количества вакансий получен успешно.")
                 return employers
 
+    def all_vacancies_query(self) -> PagedQuery:
+        """Метод для получения запроса списка всех вакансий."""
+        return PagedQuery(
+            columns=REPORT_COLUMNS,
+            tables=REPORT_TABLES,
+            where="",
+            params=(),
+            order_by=("e.name", "v.source", "v.vac_id"),
+        )
+
+    def higher_salary_query(self) -> PagedQuery:
+        """
+        Метод для получения запроса списка вакансий с зарплатой выше средней.
+
+        NULL заменяется максимальным INTEGER: порядок тот же, что у DESC (NULL первым),
+        но ключ страницы можно сравнивать как кортеж.
+        """
+        avg_salary = self.get_avg_salary()
+        return PagedQuery(
+            columns=REPORT_COLUMNS,
+            tables=REPORT_TABLES,
+            where="(salary_from IS NOT NULL AND salary_from > %s) OR (salary_to IS NOT NULL AND salary_to > %s)",
+            params=(avg_salary, avg_salary),
+            order_by=(
+                f"COALESCE(v.salary_from, {MAX_INTEGER})",
+                f"COALESCE(v.salary_to, {MAX_INTEGER})",
+                "v.source",
+                "v.vac_id",
+            ),
+            descending=True,
+        )
+
+    def keyword_query(self, keywords: List[str]) -> PagedQuery:
+        """
+        Метод для получения запроса поиска вакансий по ключевым словам в названии.
+
+        :param keywords: Список ключевых слов для поиска в названии вакансии.
+        :return: Запрос.
+        """
+        return PagedQuery(
+            columns=REPORT_COLUMNS,
+            tables=REPORT_TABLES,
+            where=" OR ".join(["title ILIKE %s"] * len(keywords)),
+            params=tuple(f"%{keyword}%" for keyword in keywords),
+            order_by=("v.title", "v.source", "v.vac_id"),
+        )
+
+    def count_rows(self, query: PagedQuery) -> int:
+        """
+        Метод для получения количества строк в результате запроса.
+
+        :param query: Запрос.
+        :return: Количество строк.
+        """
+        with self.conn:
+            with self.conn.cursor() as cur:
+                cur.execute(*query.count_sql())
+                count = cur.fetchone()[0]
+                logger.info(f"Количество строк в результате запроса: '{count}'.")
+                return int(count)
+
+    def fetch_page(
+        self, query: PagedQuery, limit: int, after: Optional[Tuple] = None
+    ) -> Tuple[List[Tuple], Optional[Tuple]]:
+        """
+        Метод для получения одной страницы результата запроса по ключу последней строки предыдущей страницы.
+
+        В отличие от OFFSET, время получения страницы не зависит от ее номера.
+
+        :param query: Запрос.
+        :param limit: Количество строк на странице.
+        :param after: Ключ последней строки предыдущей страницы (None — первая страница).
+        :return: Кортеж (строки страницы, ключ последней строки или None, если страница последняя).
+        """
+        width = len(query.order_by)
+        with self.conn:
+            with self.conn.cursor() as cur:
+                # Одна лишняя строка показывает, есть ли следующая страница
+                cur.execute(*query.page_sql(limit + 1, after))
+                rows = cur.fetchall()
+                logger.info(f"Получена страница после ключа '{after}', строк: '{min(len(rows), limit)}'.")
+        cursor = tuple(rows[limit - 1][-width:]) if len(rows) > limit else None
+        return [row[:-width] for row in rows[:limit]], cursor
+
     def get_all_vacancies(self) -> List[Tuple]:
         """Метод для получения списка всех вакансий с указанием компании, зарплаты и ссылки."""
         logger.info(f"Запущен метод 'get_all_vacancies' в классе '{type(self).__name__}'.")
+        query, params = self.all_vacancies_query().sql()
         with self.conn:
             with self.conn.cursor() as cur:
-                cur.execute(
-                    """
-                    SELECT e.name, v.title, v.salary_from, v.salary_to, v.url
-                    FROM vacancies v
-                    JOIN employers e USING (emp_id)
-                    ORDER BY e.name;
-                    """
-                )
+                cur.execute(query, params)
                 vacancies = cur.fetchall()
                 logger.info(f"Всего получено '{len(vacancies)}' вакансий.")
                 return vacancies
@@ -169,22 +408,12 @@ class DBManager:
     def get_vacancies_with_higher_salary(self) -> List[Tuple]:
         """Метод для получения списка вакансий с зарплатой выше средней по всем вакансиям."""
         logger.info(f"Запущен метод 'get_vacancies_with_higher_salary' в классе '{type(self).__name__}'.")
-        avg_salary = self.get_avg_salary()
+        query, params = self.higher_salary_query().sql()
         with self.conn:
             with self.conn.cursor() as cur:
-                cur.execute(
-                    """
-                    SELECT e.name, v.title, v.salary_from, v.salary_to, v.url
-                    FROM vacancies v
-                    JOIN employers e USING (emp_id)
-                    WHERE (salary_from IS NOT NULL AND salary_from > %s)
-                        OR (salary_to IS NOT NULL AND salary_to > %s)
-                    ORDER BY salary_from DESC, salary_to DESC;
-                    """,
-                    (avg_salary, avg_salary),
-                )
+                cur.execute(query, params)
                 vacancies = cur.fetchall()
-                logger.info(f"Получено '{len(vacancies)}' вакансий с зарплатой выше средней ({avg_salary}).")
+                logger.info(f"Получено '{len(vacancies)}' вакансий с зарплатой выше средней ({params[0]}).")
                 return vacancies
 
     def get_vacancies_with_keyword(self, keywords: List[str]) -> List[Tuple]:
@@ -197,20 +426,10 @@ class DBManager:
         logger.info(
             f"Запущен метод 'get_vacancies_with_keyword' в классе '{type(self).__name__}' с параметром: '{keywords}'."
         )
+        query, params = self.keyword_query(keywords).sql()
         with self.conn:
             with self.conn.cursor() as cur:
-                like_string = " OR ".join(["title ILIKE %s"] * len(keywords))
-                params = tuple(f"%{keyword}%" for keyword in keywords)
-                cur.execute(
-                    f"""
-                    SELECT e.name, v.title, v.salary_from, v.salary_to, v.url
-                    FROM vacancies v
-                    JOIN employers e USING (emp_id)
-                    WHERE {like_string}
-                    ORDER BY v.title;
-                    """,
-                    params,
-                )
+                cur.execute(query, params)
                 vacancies = cur.fetchall()
                 logger.info(f"Найдено '{len(vacancies)}' вакансий по ключевым словам: {keywords}.")
                 return vacancies
@@ -17,6 +17,8 @@ path_project = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 class HeadHunterAPI(VacancyAPI):
     """Класс для взаимодействия с API HeadHunter."""
 
+    source = "hh"
+
     def __init__(self) -> None:
         """Инициализация базового URL и заголовков для запросов."""
         logger.info("Создан объект класса 'HeadHunterAPI'.")
@@ -27,6 +29,7 @@ class HeadHunterAPI(VacancyAPI):
         """Проверка доступности API по базовому URL."""
         logger.info("Запущена проверка доступности API.")
         try:
+            self._throttle()
             response = requests.get(f"{self.__base_url}/employers", headers=self.__headers)
             response.raise_for_status()
         except requests.exceptions.RequestException as e:
@@ -79,6 +82,7 @@ class HeadHunterAPI(VacancyAPI):
             logger.info(f"Отправка запроса на получение данных о работодателе '{name}'.")
             params = {"text": name, "only_with_vacancies": "true", "per_page": 1}
             try:
+                self._throttle()
                 response = requests.get(f"{self.__base_url}/employers", headers=self.__headers, params=params)
                 response.raise_for_status()
                 items = response.json().get("items", [])
@@ -106,6 +110,7 @@ class HeadHunterAPI(VacancyAPI):
 
         while params["page"] < 20:
             try:
+                self._throttle()
                 response = requests.get(f"{self.__base_url}/vacancies", headers=self.__headers, params=params)
                 response.raise_for_status()
                 items = response.json().get("items", [])
@@ -0,0 +1,264 @@
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, cast
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from src.base import VacancyAPI
+from src.logger_config import add_logger
+
+# Настройка логирования
+logger = add_logger("fixture_api.log", "fixture_api")
+
+TITLES = [
+    "Python-разработчик",
+    "Java-разработчик",
+    "Инженер по тестированию",
+    "Аналитик данных",
+    "DevOps-инженер",
+    "Frontend-разработчик",
+    "Руководитель проектов",
+    "Системный аналитик",
+]
+CITIES = ["Москва", "Санкт-Петербург", "Казань", "Новосибирск", "Екатеринбург"]
+
+
+def generate_fixture(employers: int, vacancies_per_employer: int, seed: int = 42) -> Dict[str, List[Dict]]:
+    """
+    Функция для генерации тестовых работодателей и вакансий в формате API hh.ru.
+
+    ID начинаются с 1 и намеренно пересекаются с ID других площадок: уникальность в БД
+    обеспечивается парой (source, id).
+
+    :param employers: Количество работодателей.
+    :param vacancies_per_employer: Количество вакансий у каждого работодателя.
+    :param seed: Зерно генератора случайных чисел.
+    :return: Словарь со списками 'employers' и 'vacancies'.
+    """
+    rnd = random.Random(seed)
+    data: Dict[str, List[Dict]] = {"employers": [], "vacancies": []}
+    for emp_id in range(1, employers + 1):
+        data["employers"].append(
+            {
+                "id": str(emp_id),
+                "name": f"Тестовая компания {emp_id}",
+                "open_vacancies": vacancies_per_employer,
+                "alternate_url": f"https://fixture.local/employer/{emp_id}",
+            }
+        )
+        for number in range(vacancies_per_employer):
+            vac_id = (emp_id - 1) * vacancies_per_employer + number + 1
+            salary_from = rnd.choice([None, 60000, 90000, 120000, 180000])
+            data["vacancies"].append(
+                {
+                    "id": str(vac_id),
+                    "name": rnd.choice(TITLES),
+                    "salary": {"from": salary_from, "to": salary_from + 40000 if salary_from else None},
+                    "employer": {"id": str(emp_id)},
+                    "area": {"name": rnd.choice(CITIES)},
+                    "alternate_url": f"https://fixture.local/vacancy/{vac_id}",
+                }
+            )
+    return data
+
+
+class FixtureServer:
+    """Класс локального HTTP-сервера, отдающего тестовые данные в формате API hh.ru."""
+
+    def __init__(
+        self,
+        employers: int = 10,
+        vacancies_per_employer: int = 200,
+        latency: float = 0.05,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """
+        Инициализация сервера.
+
+        :param employers: Количество работодателей.
+        :param vacancies_per_employer: Количество вакансий у каждого работодателя.
+        :param latency: Искусственная задержка ответа в секундах (имитация сети).
+        :param host: Адрес сервера.
+        :param port: Порт сервера (0 — любой свободный).
+        """
+        data = generate_fixture(employers, vacancies_per_employer)
+        by_employer: Dict[str, List[Dict]] = {}
+        for item in data["vacancies"]:
+            by_employer.setdefault(item["employer"]["id"], []).append(item)
+
+        class Handler(BaseHTTPRequestHandler):
+            """Обработчик запросов /employers и /vacancies с постраничной выдачей."""
+
+            def do_GET(self) -> None:
+                time.sleep(latency)
+                url = urlparse(self.path)
+                params = {key: values[0] for key, values in parse_qs(url.query).items()}
+                if url.path == "/employers":
+                    items = data["employers"]
+                elif url.path == "/vacancies":
+                    items = by_employer.get(params.get("employer_id", ""), [])
+                else:
+                    self.send_error(404)
+                    return
+                page, per_page = int(params.get("page", 0)), int(params.get("per_page", 20))
+                body = json.dumps(
+                    {
+                        "items": items[page * per_page : (page + 1) * per_page],
+                        "found": len(items),
+                        "page": page,
+                        "pages": -(-len(items) // per_page),
+                    },
+                    ensure_ascii=False,
+                ).encode("UTF-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json; charset=UTF-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                logger.debug(f"{self.address_string()} - {format % args}")
+
+        self.__server = ThreadingHTTPServer((host, port), Handler)
+        self.__server.daemon_threads = True
+        self.__thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "FixtureServer":
+        return self.start()
+
+    def __exit__(self, exc_type: Optional[type], exc: Optional[BaseException], tb: object) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """Геттер для получения базового URL сервера."""
+        host, port = self.__server.server_address[:2]
+        return f"http://{cast(str, host)}:{port}"
+
+    def start(self) -> "FixtureServer":
+        """Метод для запуска сервера в фоновом потоке."""
+        self.__thread = threading.Thread(target=self.__server.serve_forever, name="fixture-server", daemon=True)
+        self.__thread.start()
+        logger.info(f"Тестовый сервер запущен: {self.url}.")
+        return self
+
+    def stop(self) -> None:
+        """Метод для остановки сервера."""
+        self.__server.shutdown()
+        self.__server.server_close()
+        logger.info("Тестовый сервер остановлен.")
+
+
+class FixtureAPI(VacancyAPI):
+    """Класс эталонного второго источника: клиент локального тестового сервера в формате API hh.ru."""
+
+    source = "fixture"
+
+    def __init__(self, base_url: Optional[str] = None, per_page: int = 100) -> None:
+        """
+        Инициализация клиента. Если базовый URL не указан, запускается встроенный тестовый сервер,
+        который останавливается методом `close()`.
+
+        :param base_url: Базовый URL тестового сервера.
+        :param per_page: Количество записей на странице выдачи.
+        """
+        self.__server: Optional[FixtureServer] = None
+        if base_url is None:
+            self.__server = FixtureServer().start()
+            base_url = self.__server.url
+        self.__base_url = base_url
+        self.__per_page = per_page
+        logger.info(f"Создан объект класса 'FixtureAPI'. Базовый URL: '{self.__base_url}'.")
+
+    def close(self) -> None:
+        """Метод для остановки встроенного тестового сервера (если он был запущен клиентом)."""
+        if self.__server is not None:
+            self.__server.stop()
+            self.__server = None
+
+    def _connect(self) -> None:
+        """Проверка доступности тестового сервера."""
+        logger.info("Запущена проверка доступности тестового сервера.")
+        try:
+            self._throttle()
+            response = requests.get(f"{self.__base_url}/employers", params={"per_page": 1}, timeout=10)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.critical(f"Ошибка подключения к тестовому серверу: {e}.", exc_info=True)
+            raise
+
+    def __get_pages(self, path: str, params: Dict) -> List[Dict]:
+        """Загружает все страницы выдачи по указанному пути."""
+        items: List[Dict] = []
+        page = 0
+        while True:
+            try:
+                self._throttle()
+                page_params = {**params, "page": page, "per_page": self.__per_page}
+                response = requests.get(f"{self.__base_url}{path}", params=page_params, timeout=10)
+                response.raise_for_status()
+                payload = response.json()
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Ошибка запроса '{path}' (стр. {page}): {e}", exc_info=True)
+                break
+            items.extend(payload.get("items", []))
+            page += 1
+            if page >= payload.get("pages", 0):
+                break
+        return items
+
+    def get_employers(self) -> List[Dict]:
+        """
+        Метод для получения всех работодателей тестового сервера.
+
+        :return: Список словарей с краткой информацией.
+        """
+        logger.info("Запущен метод 'get_employers' для получения информации о работодателях.")
+        try:
+            self._connect()
+        except requests.exceptions.RequestException:
+            logger.error("Прекращена работа метода 'get_employers' из-за ошибки подключения.")
+            return []
+        employers = self.__get_pages("/employers", {})
+        logger.info(f"Количество работодателей о которых получена информация: {len(employers)}.")
+        return employers
+
+    def get_vacancies(self, employer_id: int) -> List[Dict]:
+        """
+        Метод для получения всех вакансий по ID работодателя.
+
+        :param employer_id: Идентификатор работодателя
+        :return: Список словарей с вакансиями
+        """
+        logger.info(f"Запущен метод 'get_vacancies' для получения вакансий работодателя '{employer_id}'.")
+        vacancies = self.__get_pages("/vacancies", {"employer_id": employer_id})
+        logger.info(f"Количество полученных вакансий работодателя '{employer_id}': {len(vacancies)}.")
+        return vacancies
+
+
+def main() -> None:
+    """Точка входа для запуска тестового сервера: `python -m src.fixture_api --port 8000`."""
+    parser = argparse.ArgumentParser(description="Локальный тестовый сервер вакансий в формате API hh.ru.")
+    parser.add_argument("--port", type=int, default=8000, help="Порт сервера.")
+    parser.add_argument("--employers", type=int, default=10, help="Количество работодателей.")
+    parser.add_argument("--vacancies", type=int, default=200, help="Количество вакансий у каждого работодателя.")
+    parser.add_argument("--latency", type=float, default=0.05, help="Задержка ответа в секундах.")
+    args = parser.parse_args()
+
+    server = FixtureServer(args.employers, args.vacancies, args.latency, port=args.port).start()
+    print(f"🧪 Тестовый сервер запущен: {server.url}. Для остановки нажмите Ctrl+C.")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
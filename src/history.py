@@ -0,0 +1,360 @@
+import os
+import re
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from src.db_manager import DBManager, migrate_source_key
+from src.logger_config import add_logger
+from src.models import DEFAULT_SOURCE, Vacancy
+
+# Загрузка переменных окружения
+load_dotenv()
+HISTORY_MODE = os.getenv("HISTORY_MODE", "false").strip().lower() in ("1", "true", "yes")
+HISTORY_RETENTION_WEEKS = int(os.getenv("HISTORY_RETENTION_WEEKS", "26"))
+
+# Настройка логирования
+logger = add_logger("history.log", "history")
+
+# Партиции создаются по неделям (с понедельника), имя содержит дату начала недели
+PARTITION_PREFIX = "vacancy_history_w"
+PARTITION_PATTERN = re.compile(rf"^{PARTITION_PREFIX}(\d{{8}})$")
+
+# Значение зарплаты вакансии — то же выражение, что и в DBManager.get_avg_salary. История хранит зарплаты так же,
+# как таблица vacancies (неуказанная зарплата — 0), поэтому недельные средние совпадают со средней зарплатой меню
+SALARY_EXPRESSION = """
+    CASE
+        WHEN salary_from IS NOT NULL AND salary_to IS NOT NULL THEN (salary_from + salary_to) / 2
+        WHEN salary_from IS NOT NULL THEN salary_from
+        WHEN salary_to IS NOT NULL THEN salary_to
+        ELSE NULL
+    END
+"""
+
+
+def week_start(day: date) -> date:
+    """
+    Функция для получения даты понедельника недели, в которую попадает день.
+
+    :param day: Дата.
+    :return: Дата начала недели.
+    """
+    return day - timedelta(days=day.weekday())
+
+
+def partition_name(day: date) -> str:
+    """
+    Функция для получения имени недельной партиции, в которую попадает день.
+
+    :param day: Дата.
+    :return: Имя партиции.
+    """
+    return f"{PARTITION_PREFIX}{week_start(day):%Y%m%d}"
+
+
+def partition_week(name: str) -> Optional[date]:
+    """
+    Функция для получения даты начала недели по имени партиции.
+
+    :param name: Имя таблицы.
+    :return: Дата начала недели или None, если таблица не является недельной партицией.
+    """
+    match = PARTITION_PATTERN.match(name)
+    if not match:
+        return None
+    raw = match.group(1)
+    return date(int(raw[:4]), int(raw[4:6]), int(raw[6:]))
+
+
+def retention_cutoff(keep_weeks: int, today: Optional[date] = None) -> date:
+    """
+    Функция для получения границы хранения: партиции недель раньше этой даты удаляются.
+
+    :param keep_weeks: Количество последних недель, которые хранятся детально (не считая текущей).
+    :param today: Текущая дата (по умолчанию — сегодня).
+    :return: Дата начала самой старой хранимой недели.
+    """
+    return week_start(today or date.today()) - timedelta(weeks=keep_weeks)
+
+
+def weekly_avg_salary_query(
+    start: date, end: date, emp_id: Optional[int] = None, source: str = DEFAULT_SOURCE
+) -> Tuple[str, Tuple]:
+    """
+    Функция для получения запроса недельной динамики средней зарплаты в виде (SQL, параметры).
+
+    :param start: Начальная дата периода.
+    :param end: Конечная дата периода (включительно).
+    :param emp_id: ID компании для фильтрации (по умолчанию — все компании).
+    :param source: Код источника, к которому относится `emp_id`.
+    :return: Кортеж (SQL-запрос, параметры).
+    """
+    period = (week_start(start), week_start(end) + timedelta(weeks=1))
+    emp_filter = "AND source = %s AND emp_id = %s" if emp_id is not None else ""
+    emp_params = (source, emp_id) if emp_id is not None else ()
+    return (
+        f"""
+        SELECT t.week_start, e.name, t.avg_salary, t.vacancy_count
+        FROM (
+            SELECT date_trunc('week', snapshot_date)::date AS week_start, source, emp_id,
+                ROUND(AVG({SALARY_EXPRESSION}), 2) AS avg_salary,
+                COUNT(DISTINCT vac_id) AS vacancy_count
+            FROM vacancy_history
+            WHERE snapshot_date >= %s AND snapshot_date < %s {emp_filter}
+            GROUP BY 1, 2, 3
+            UNION ALL
+            SELECT week_start, source, emp_id,
+                ROUND(salary_sum::numeric / NULLIF(salary_count, 0), 2),
+                vacancy_count
+            FROM vacancy_history_weekly
+            WHERE week_start >= %s AND week_start < %s {emp_filter}
+        ) t
+        JOIN employers e USING (source, emp_id)
+        ORDER BY t.week_start, e.name;
+        """,
+        period + emp_params + period + emp_params,
+    )
+
+
+def vacancy_count_trend_query(start: date, end: date) -> Tuple[str, Tuple]:
+    """
+    Функция для получения запроса количества вакансий компаний по датам снимков в виде (SQL, параметры).
+
+    :param start: Начальная дата периода.
+    :param end: Конечная дата периода (включительно).
+    :return: Кортеж (SQL-запрос, параметры).
+    """
+    return (
+        """
+        SELECT h.snapshot_date, e.name, COUNT(h.vac_id) AS vacancy_count
+        FROM vacancy_history h
+        JOIN employers e USING (source, emp_id)
+        WHERE h.snapshot_date >= %s AND h.snapshot_date <= %s
+        GROUP BY h.snapshot_date, e.name
+        ORDER BY h.snapshot_date, e.name;
+        """,
+        (start, end),
+    )
+
+
+class VacancyHistoryManager:
+    """Класс для хранения истории вакансий в таблице, секционированной по дате снимка."""
+
+    def __init__(self, db_manager: DBManager) -> None:
+        """
+        Инициализация менеджера истории поверх существующего подключения к БД.
+
+        :param db_manager: Объект подключения к БД.
+        """
+        self.conn = db_manager.conn
+        logger.info("Создан объект класса 'VacancyHistoryManager'.")
+
+    def create_tables(self) -> None:
+        """Метод для создания секционированной таблицы истории и таблицы недельных агрегатов."""
+        logger.info(f"Запущен метод 'create_tables' в классе '{type(self).__name__}'.")
+        with self.conn:
+            with self.conn.cursor() as cur:
+                cur.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS vacancy_history (
+                        snapshot_date DATE NOT NULL,
+                        source TEXT NOT NULL DEFAULT 'hh',
+                        vac_id INTEGER NOT NULL,
+                        emp_id INTEGER NOT NULL,
+                        salary_from INTEGER,
+                        salary_to INTEGER,
+                        PRIMARY KEY (snapshot_date, source, vac_id)
+                    ) PARTITION BY RANGE (snapshot_date);
+                    """
+                )
+                cur.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS vacancy_history_weekly (
+                        week_start DATE NOT NULL,
+                        source TEXT NOT NULL DEFAULT 'hh',
+                        emp_id INTEGER NOT NULL,
+                        vacancy_count INTEGER NOT NULL,
+                        salary_count INTEGER NOT NULL,
+                        salary_sum BIGINT,
+                        PRIMARY KEY (week_start, source, emp_id)
+                    );
+                    """
+                )
+                # Таблицы предыдущих версий (без source) переводятся на ключи с кодом источника
+                migrate_source_key(cur, "vacancy_history", ("snapshot_date", "source", "vac_id"))
+                migrate_source_key(cur, "vacancy_history_weekly", ("week_start", "source", "emp_id"))
+                logger.info("Таблицы vacancy_history и vacancy_history_weekly созданы успешно.")
+
+    def ensure_partition(self, snapshot_date: date) -> str:
+        """
+        Метод для создания недельной партиции, в которую попадает дата снимка (если ее еще нет).
+
+        :param snapshot_date: Дата снимка.
+        :return: Имя партиции.
+        """
+        start = week_start(snapshot_date)
+        name = partition_name(snapshot_date)
+        with self.conn:
+            with self.conn.cursor() as cur:
+                cur.execute(
+                    f"""
+                    CREATE TABLE IF NOT EXISTS {name} PARTITION OF vacancy_history
+                    FOR VALUES FROM (%s) TO (%s);
+                    """,
+                    (start, start + timedelta(weeks=1)),
+                )
+        logger.info(f"Партиция '{name}' готова.")
+        return name
+
+    def get_partitions(self) -> List[Tuple[str, date]]:
+        """Метод для получения списка недельных партиций в виде (имя, дата начала недели)."""
+        with self.conn:
+            with self.conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT c.relname
+                    FROM pg_inherits i
+                    JOIN pg_class c ON c.oid = i.inhrelid
+                    JOIN pg_class p ON p.oid = i.inhparent
+                    WHERE p.relname = 'vacancy_history';
+                    """
+                )
+                names = [row[0] for row in cur.fetchall()]
+        partitions = []
+        for name in names:
+            start = partition_week(name)
+            if start is not None:
+                partitions.append((name, start))
+        return sorted(partitions, key=lambda item: item[1])
+
+    def record_snapshot(self, vacancies: List[Vacancy], snapshot_date: Optional[date] = None) -> None:
+        """
+        Метод для добавления в историю одной записи на каждую вакансию за синхронизацию.
+
+        Повторная синхронизация в тот же день обновляет запись, а не добавляет новую. Снимок за неделю,
+        уже свернутую политикой хранения, не принимается: иначе неделя попала бы в динамику дважды, а при
+        следующем сжатии ее агрегат был бы заменен агрегатом только новых записей.
+
+        :param vacancies: Список вакансий.
+        :param snapshot_date: Дата снимка (по умолчанию — сегодня).
+        :raises ValueError: Если неделя снимка уже свернута в vacancy_history_weekly.
+        """
+        snapshot_date = snapshot_date or date.today()
+        logger.info(f"Запущен метод 'record_snapshot'. Дата: '{snapshot_date}'. Вакансий: '{len(vacancies)}'.")
+        with self.conn:
+            with self.conn.cursor() as cur:
+                cur.execute(
+                    "SELECT 1 FROM vacancy_history_weekly WHERE week_start = %s LIMIT 1;", (week_start(snapshot_date),)
+                )
+                compacted = cur.fetchone() is not None
+        if compacted:
+            logger.error(f"Снимок за '{snapshot_date}' отклонен: неделя уже свернута политикой хранения.")
+            raise ValueError(f"Неделя снимка '{snapshot_date}' уже свернута политикой хранения.")
+        self.ensure_partition(snapshot_date)
+        with self.conn:
+            with self.conn.cursor() as cur:
+                cur.executemany(
+                    """
+                    INSERT INTO vacancy_history(snapshot_date, source, vac_id, emp_id, salary_from, salary_to)
+                    VALUES (%s, %s, %s, %s, %s, %s)
+                    ON CONFLICT (snapshot_date, source, vac_id) DO UPDATE
+                    SET emp_id = EXCLUDED.emp_id,
+                        salary_from = EXCLUDED.salary_from,
+                        salary_to = EXCLUDED.salary_to;
+                    """,
+                    [
+                        (
+                            snapshot_date,
+                            vac.source,
+                            vac.vac_id,
+                            vac.emp_id,
+                            vac.salary_from,
+                            vac.salary_to,
+                        )
+                        for vac in vacancies
+                    ],
+                )
+        logger.info("Снимок вакансий успешно добавлен в историю.")
+
+    def apply_retention(self, keep_weeks: int = HISTORY_RETENTION_WEEKS, compact: bool = True) -> List[str]:
+        """
+        Метод для применения политики хранения: партиции старше `keep_weeks` недель удаляются.
+
+        При `compact=True` перед удалением данные партиции сворачиваются в недельные агрегаты
+        (vacancy_history_weekly), поэтому тренды по старым неделям остаются доступны.
+
+        :param keep_weeks: Количество последних недель, которые хранятся детально.
+        :param compact: Сохранять ли недельные агрегаты удаляемых партиций.
+        :return: Список удаленных партиций.
+        """
+        cutoff = retention_cutoff(keep_weeks)
+        logger.info(f"Запущен метод 'apply_retention'. Граница хранения: '{cutoff}'. Сжатие: {compact}.")
+        dropped = []
+        for name, start in self.get_partitions():
+            if start >= cutoff:
+                continue
+            with self.conn:
+                with self.conn.cursor() as cur:
+                    if compact:
+                        cur.execute(
+                            f"""
+                            INSERT INTO vacancy_history_weekly(
+                                week_start, source, emp_id, vacancy_count, salary_count, salary_sum
+                            )
+                            SELECT %s, source, emp_id, COUNT(DISTINCT vac_id), COUNT({SALARY_EXPRESSION}),
+                                SUM({SALARY_EXPRESSION})
+                            FROM {name}
+                            GROUP BY source, emp_id
+                            ON CONFLICT (week_start, source, emp_id) DO UPDATE
+                            SET vacancy_count = EXCLUDED.vacancy_count,
+                                salary_count = EXCLUDED.salary_count,
+                                salary_sum = EXCLUDED.salary_sum;
+                            """,
+                            (start,),
+                        )
+                    cur.execute(f"ALTER TABLE vacancy_history DETACH PARTITION {name};")
+                    cur.execute(f"DROP TABLE {name};")
+            dropped.append(name)
+            logger.info(f"Партиция '{name}' удалена.")
+        logger.info(f"Политика хранения применена. Удалено партиций: {len(dropped)}.")
+        return dropped
+
+    def get_weekly_avg_salary(
+        self, start: date, end: date, emp_id: Optional[int] = None, source: str = DEFAULT_SOURCE
+    ) -> List[Tuple]:
+        """
+        Метод для получения средней зарплаты и количества вакансий по неделям для каждой компании.
+
+        Условие по snapshot_date позволяет PostgreSQL читать только партиции нужных недель;
+        недели, уже свернутые политикой хранения, берутся из vacancy_history_weekly.
+
+        :param start: Начальная дата периода.
+        :param end: Конечная дата периода (включительно).
+        :param emp_id: ID компании для фильтрации (по умолчанию — все компании).
+        :param source: Код источника, к которому относится `emp_id`.
+        :return: Список (начало недели, компания, средняя зарплата, количество вакансий).
+        """
+        logger.info(f"Запущен метод 'get_weekly_avg_salary'. Период: '{start}' — '{end}'. Компания: '{emp_id}'.")
+        with self.conn:
+            with self.conn.cursor() as cur:
+                cur.execute(*weekly_avg_salary_query(start, end, emp_id, source))
+                trend: List[Tuple] = cur.fetchall()
+                logger.info(f"Получено '{len(trend)}' строк недельной динамики зарплат.")
+                return trend
+
+    def get_vacancy_count_trend(self, start: date, end: date) -> List[Tuple]:
+        """
+        Метод для получения количества открытых вакансий каждой компании на каждую дату снимка.
+
+        :param start: Начальная дата периода.
+        :param end: Конечная дата периода (включительно).
+        :return: Список (дата снимка, компания, количество вакансий).
+        """
+        logger.info(f"Запущен метод 'get_vacancy_count_trend'. Период: '{start}' — '{end}'.")
+        with self.conn:
+            with self.conn.cursor() as cur:
+                cur.execute(*vacancy_count_trend_query(start, end))
+                trend: List[Tuple] = cur.fetchall()
+                logger.info(f"Получено '{len(trend)}' строк динамики количества вакансий.")
+                return trend
@@ -5,13 +5,16 @@ from src.logger_config import add_logger
 # Настройка логирования
 logger = add_logger("models.log", "models")
 
+# Код источника по умолчанию — hh.ru
+DEFAULT_SOURCE = "hh"
+
 
 class Employer:
     """Класс для представления работодателя."""
 
-    __slots__ = ("__emp_id", "__name", "__vac_count", "__url")
+    __slots__ = ("__emp_id", "__name", "__vac_count", "__url", "__source")
 
-    def __init__(self, emp_id: int, name: str, vac_count: int, url: str) -> None:
+    def __init__(self, emp_id: int, name: str, vac_count: int, url: str, source: str = DEFAULT_SOURCE) -> None:
         """
         Инициализация объекта работодателя.
 
@@ -19,11 +22,13 @@ class Employer:
         :param name: Название компании.
         :param vac_count: Количество открытых вакансий.
         :param url: Ссылка на страницу работодателя.
+        :param source: Код источника (площадки) данных.
         """
         self.__emp_id = emp_id if emp_id is not None else -1
         self.__name = name.strip() if name else "Без названия"
         self.__vac_count = vac_count if vac_count is not None else 0
         self.__url = url.strip() if url else "Ссылка не указана"
+        self.__source = source
         logger.info(f"Создан объект класса Employer для компании - {self.__name}.")
 
     def __repr__(self) -> str:
@@ -50,11 +55,21 @@ class Employer:
         """Геттер для получения ссылки на страницу работодателя."""
         return self.__url
 
+    @property
+    def source(self) -> str:
+        """Геттер для получения кода источника данных."""
+        return self.__source
+
+    @property
+    def uid(self) -> str:
+        """Геттер для получения идентификатора работодателя с указанием источника (например, 'hh:123')."""
+        return f"{self.__source}:{self.__emp_id}"
+
 
 class Vacancy:
     """Класс для представления вакансии."""
 
-    __slots__ = ("__vac_id", "__title", "__salary_from", "__salary_to", "__emp_id", "__city", "__url")
+    __slots__ = ("__vac_id", "__title", "__salary_from", "__salary_to", "__emp_id", "__city", "__url", "__source")
 
     def __init__(
         self,
@@ -65,6 +80,7 @@ class Vacancy:
         emp_id: int,
         city: str,
         url: str,
+        source: str = DEFAULT_SOURCE,
     ) -> None:
         """
         Инициализирует объект вакансии.
@@ -76,6 +92,7 @@ class Vacancy:
         :param emp_id: ID компании.
         :param city: Город.
         :param url: Ссылка на вакансию.
+        :param source: Код источника (площадки) данных.
         """
         self.__vac_id = vac_id if vac_id is not None else -1
         self.__title = title.strip() if title else "Без названия"
@@ -84,6 +101,7 @@ class Vacancy:
         self.__emp_id = emp_id if emp_id is not None else -1
         self.__city = city.strip() if city else "Город не указан"
         self.__url = url.strip() if url else "Ссылка не указана"
+        self.__source = source
         logger.info(f"Создан объект класса Vacancy для вакансии - {self.__title} (ID:{self.__vac_id}).")
 
     def __repr__(self) -> str:
@@ -136,3 +154,13 @@ class Vacancy:
     def url(self) -> str:
         """Геттер для получения ссылки на вакансию."""
         return self.__url
+
+    @property
+    def source(self) -> str:
+        """Геттер для получения кода источника данных."""
+        return self.__source
+
+    @property
+    def uid(self) -> str:
+        """Геттер для получения идентификатора вакансии с указанием источника (например, 'hh:456')."""
+        return f"{self.__source}:{self.__vac_id}"
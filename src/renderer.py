@@ -0,0 +1,202 @@
+import math
+import sys
+from typing import TYPE_CHECKING, Callable, List, Optional, TextIO, Tuple
+
+from src.logger_config import add_logger
+
+if TYPE_CHECKING:
+    from src.db_manager import DBManager, PagedQuery
+
+# Настройка логирования
+logger = add_logger("renderer.log", "renderer")
+
+PAGE_SIZE = 20
+
+NAVIGATION_HINT = "[Enter/n] — далее, [p] — назад, [номер] — перейти к странице, [q] — выход"
+
+
+def format_salary(salary_from: Optional[int], salary_to: Optional[int]) -> str:
+    """
+    Функция для форматирования вилки зарплаты.
+
+    :param salary_from: Нижняя граница зарплаты.
+    :param salary_to: Верхняя граница зарплаты.
+    :return: Строка с зарплатой.
+    """
+    if salary_from and salary_to:
+        if salary_from == salary_to and salary_from > 0:
+            return f"{salary_from} ₽"
+        return f"{salary_from} — {salary_to} ₽"
+    if salary_from and salary_from > 0:
+        return f"от {salary_from} ₽"
+    if salary_to and salary_to > 0:
+        return f"до {salary_to} ₽"
+    return "Зарплата не указана"
+
+
+def format_vacancy(vacancy: Tuple) -> str:
+    """
+    Функция для форматирования строки вакансии (компания, название, зарплата от, зарплата до, ссылка).
+
+    :param vacancy: Строка результата запроса.
+    :return: Отформатированная строка.
+    """
+    return f"➢ {vacancy[1]} | Компания: {vacancy[0]} | {format_salary(vacancy[2], vacancy[3])} | {vacancy[4]}"
+
+
+class ResultPager:
+    """
+    Класс для постраничного вывода результатов запроса с навигацией.
+
+    Страницы читаются по ключу последней строки предыдущей страницы (keyset pagination): ключи начала
+    уже просмотренных страниц запоминаются, поэтому переходы вперед и назад не зависят от номера страницы.
+    Общее количество строк запрашивается только после вывода первой страницы.
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[int, Optional[Tuple]], Tuple[List[Tuple], Optional[Tuple]]],
+        count: Callable[[], int],
+        formatter: Callable[[Tuple], str] = format_vacancy,
+        page_size: int = PAGE_SIZE,
+        output: TextIO = sys.stdout,
+    ) -> None:
+        """
+        Инициализация постраничного вывода.
+
+        :param fetch_page: Функция получения страницы по (limit, ключ предыдущей страницы), возвращающая
+            (строки, ключ последней строки или None, если страница последняя).
+        :param count: Функция получения общего количества строк (вызывается один раз, при первом обращении).
+        :param formatter: Функция форматирования одной строки.
+        :param page_size: Количество строк на странице.
+        :param output: Поток вывода.
+        """
+        self.__fetch_page = fetch_page
+        self.__count = count
+        self.__total: Optional[int] = None
+        self.__cursors: List[Optional[Tuple]] = [None]
+        self.__last_page: Optional[int] = None
+        self.formatter = formatter
+        self.page_size = page_size
+        self.output = output
+        self.page = 1
+
+    @classmethod
+    def from_query(
+        cls, db_manager: "DBManager", query: "PagedQuery", formatter: Callable[[Tuple], str] = format_vacancy
+    ) -> "ResultPager":
+        """
+        Метод для создания постраничного вывода по запросу DBManager.
+
+        :param db_manager: Объект подключения к БД.
+        :param query: Запрос.
+        :param formatter: Функция форматирования одной строки.
+        :return: Объект постраничного вывода.
+        """
+        return cls(
+            lambda limit, after: db_manager.fetch_page(query, limit, after),
+            lambda: db_manager.count_rows(query),
+            formatter,
+        )
+
+    @classmethod
+    def from_rows(cls, rows: List[Tuple], formatter: Callable[[Tuple], str] = format_vacancy) -> "ResultPager":
+        """
+        Метод для создания постраничного вывода по готовому списку строк (ключ страницы — позиция в списке).
+
+        :param rows: Список строк.
+        :param formatter: Функция форматирования одной строки.
+        :return: Объект постраничного вывода.
+        """
+
+        def fetch_page(limit: int, after: Optional[Tuple]) -> Tuple[List[Tuple], Optional[Tuple]]:
+            start = after[0] if after else 0
+            return rows[start : start + limit], (start + limit,) if start + limit < len(rows) else None
+
+        return cls(fetch_page, lambda: len(rows), formatter)
+
+    @property
+    def total(self) -> int:
+        """Геттер для получения общего количества строк."""
+        if self.__total is None:
+            self.__total = self.__count()
+        return self.__total
+
+    @property
+    def pages(self) -> int:
+        """Геттер для получения количества страниц."""
+        if self.__last_page is not None:
+            return self.__last_page
+        return max(1, math.ceil(self.total / self.page_size))
+
+    @property
+    def has_next(self) -> bool:
+        """Геттер, показывающий, есть ли страница после текущей."""
+        return self.__last_page is None or self.page < self.__last_page
+
+    def __load(self, page: int) -> List[Tuple]:
+        """Загружает страницу, при переходе вперед проходя по ключам от последней известной страницы."""
+        page = max(page, 1)
+        while True:
+            number = min(page, len(self.__cursors), self.__last_page or page)
+            rows, cursor = self.__fetch_page(self.page_size, self.__cursors[number - 1])
+            if cursor is None:
+                self.__last_page = number
+            elif number == len(self.__cursors):
+                self.__cursors.append(cursor)
+            if number == page or cursor is None:
+                self.page = number
+                return rows
+
+    def render(self, page: int) -> int:
+        """
+        Метод для вывода страницы: строки и строка с номером страницы выводятся одной записью в поток.
+
+        Пока общее количество строк неизвестно, выводится только номер страницы; количество запрашивается
+        сразу после вывода, поэтому первая страница не ждет подсчета.
+
+        :param page: Номер страницы (с 1). Номер больше последнего выводит последнюю страницу.
+        :return: Количество выведенных строк.
+        """
+        rows = self.__load(page)
+        if not rows:
+            self.output.write("⚠️ Ничего не найдено.\n")
+            self.output.flush()
+            return 0
+        buffer = [self.formatter(row) for row in rows]
+        if self.__total is not None:
+            buffer.append(f"\nСтраница {self.page} из {self.pages} (всего: {self.__total}). {NAVIGATION_HINT}\n")
+        elif self.__last_page is not None:
+            buffer.append(f"\nСтраница {self.page} из {self.__last_page}. {NAVIGATION_HINT}\n")
+        else:
+            buffer.append(f"\nСтраница {self.page}. {NAVIGATION_HINT}\n")
+        self.output.write("\n".join(buffer))
+        self.output.flush()
+        total = self.total
+        logger.info(f"Выведена страница {self.page}/{self.pages}, строк: {len(rows)}. Всего строк: {total}.")
+        return len(rows)
+
+    def browse(self) -> None:
+        """Метод для интерактивного просмотра результата: далее, назад, переход к странице и выход."""
+        logger.info("Запущен просмотр результата.")
+        if not self.render(1):
+            return
+        try:
+            while True:
+                command = input("Навигация: ").strip().lower()
+                if command in ("", "n"):
+                    if not self.has_next:
+                        break
+                    self.render(self.page + 1)
+                elif command == "p":
+                    self.render(self.page - 1)
+                elif command.isdigit():
+                    self.render(int(command))
+                elif command == "q":
+                    break
+                else:
+                    self.output.write(f"⚠️ Некорректная команда. {NAVIGATION_HINT}\n")
+                    self.output.flush()
+        except (KeyboardInterrupt, EOFError):
+            self.output.write("\n")
+        logger.info(f"Просмотр результата завершен на странице {self.page}.")
@@ -0,0 +1,350 @@
+import os
+import re
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from functools import lru_cache
+from heapq import merge
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from dotenv import load_dotenv
+
+from src.logger_config import add_logger
+from src.models import Employer, Vacancy
+from src.utils import collation_key
+
+if TYPE_CHECKING:
+    from src.db_manager import DBManager
+    from src.snapshot import SnapshotReader
+
+# Загрузка переменных окружения
+load_dotenv()
+SEARCH_INDEX_MODE = os.getenv("SEARCH_INDEX_MODE", "false").strip().lower() in ("1", "true", "yes")
+
+# Настройка логирования
+logger = add_logger("search_index.log", "search_index")
+
+WORD_PATTERN = re.compile(r"\w+")
+
+# Окончания для облегченного стемминга (русские и английские), от длинных к коротким
+SUFFIXES = sorted(
+    (
+        "ями ами ого его ому ему ыми ими иях иям ией ов ев ей ой ий ый ая яя ое ее ие ые ам ям ах ях ом ем ую юю "
+        "а я ы и о е у ю ь й ing ers er es ed s"
+    ).split(),
+    key=len,
+    reverse=True,
+)
+MIN_STEM_LENGTH = 3
+
+# Максимальная длина n-грамм словаря названий и количество запросов в кэше результатов
+MAX_GRAM_LENGTH = 3
+CACHE_SIZE = 256
+
+# Запрос для построения индекса по данным БД: те же строки, что и в отчетах DBManager, плюс ID, город и работодатель
+INDEX_QUERY = """
+    SELECT v.source, v.vac_id, v.title, v.salary_from, v.salary_to, v.city, v.url, v.emp_id, e.name
+    FROM vacancies v
+    JOIN employers e USING (source, emp_id)
+    ORDER BY v.source, v.vac_id
+"""
+
+
+@lru_cache(maxsize=100000)
+def stem(word: str) -> str:
+    """
+    Функция для облегченного стемминга: отрезает одно наиболее длинное подходящее окончание.
+
+    Результаты кэшируются: словарь названий вакансий невелик, а слова в нем часто повторяются.
+
+    :param word: Слово в нижнем регистре.
+    :return: Основа слова.
+    """
+    for suffix in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM_LENGTH:
+            return word[: -len(suffix)]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Функция для разбиения текста на нормализованные (нижний регистр + стемминг) токены.
+
+    :param text: Исходный текст.
+    :return: Список токенов.
+    """
+    return [stem(word) for word in WORD_PATTERN.findall(text.lower())]
+
+
+def grams(word: str, length: int) -> Set[str]:
+    """
+    Функция для получения множества подстрок слова заданной длины (n-грамм).
+
+    :param word: Слово.
+    :param length: Длина n-граммы.
+    :return: Множество n-грамм.
+    """
+    return {word[start : start + length] for start in range(len(word) - length + 1)}
+
+
+def intersect(postings: Sequence[array]) -> List[int]:
+    """
+    Функция для пересечения отсортированных списков документов.
+
+    Обход начинается с самого короткого списка, в остальных поиск идет бинарным поиском с текущей позиции.
+
+    :param postings: Отсортированные списки ID документов.
+    :return: ID документов, входящих во все списки.
+    """
+    if not postings:
+        return []
+    ordered = sorted(postings, key=len)
+    positions = [0] * len(ordered)
+    result = []
+    for doc_id in ordered[0]:
+        for index in range(1, len(ordered)):
+            positions[index] = bisect_left(ordered[index], doc_id, positions[index])
+            if positions[index] == len(ordered[index]) or ordered[index][positions[index]] != doc_id:
+                break
+        else:
+            result.append(doc_id)
+    return result
+
+
+def union(postings: Sequence[array]) -> List[int]:
+    """
+    Функция для объединения отсортированных списков документов без повторов.
+
+    :param postings: Отсортированные списки ID документов.
+    :return: ID документов, входящих хотя бы в один список.
+    """
+    result: List[int] = []
+    for doc_id in merge(*postings):
+        if not result or result[-1] != doc_id:
+            result.append(doc_id)
+    return result
+
+
+class VacancySearchIndex:
+    """
+    Класс встроенного инвертированного индекса вакансий для повторного поиска в памяти.
+
+    Хранит два индекса: по словам названия без изменений (для точного совпадения с
+    `DBManager.get_vacancies_with_keyword`) и по нормализованным токенам названия и города (для `search`).
+    Для поиска подстроки словарь слов названий проиндексирован по n-граммам длиной до `MAX_GRAM_LENGTH`.
+    Списки документов хранятся в компактных массивах `array('I')` и отсортированы по ID документа.
+    """
+
+    def __init__(self, employers: Optional[List[Employer]] = None) -> None:
+        """
+        Инициализация пустого индекса.
+
+        :param employers: Список работодателей для отображения названий компаний в результатах.
+        """
+        self.__employer_names: Dict[Tuple[str, int], str] = {}
+        self.__rows: List[Tuple] = []
+        self.__keys: List[Tuple[str, int]] = []
+        self.__doc_ids: Dict[Tuple[str, int], int] = {}
+        self.__title_postings: Dict[str, array] = {}
+        self.__token_postings: Dict[str, array] = {}
+        self.__words: List[str] = []
+        self.__gram_postings: Dict[str, array] = {}
+        self.__cache: OrderedDict[Tuple[str, ...], List[Tuple]] = OrderedDict()
+        if employers:
+            self.add_employers(employers)
+        logger.info("Создан объект класса 'VacancySearchIndex'.")
+
+    def __len__(self) -> int:
+        """Возвращает количество проиндексированных вакансий."""
+        return len(self.__rows)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple]) -> "VacancySearchIndex":
+        """
+        Метод для построения индекса по строкам (source, vac_id, title, salary_from, salary_to, city, url, emp_id,
+        компания). Работодатели строк запоминаются, поэтому индекс можно пополнять их новыми вакансиями.
+
+        :param rows: Строки вакансий.
+        :return: Объект индекса.
+        """
+        index = cls()
+        for row in rows:
+            index.__add(*row)
+        index.__cache.clear()
+        logger.info(f"Индекс построен по строкам. Вакансий: {len(index)}.")
+        return index
+
+    @classmethod
+    def from_db(cls, db_manager: "DBManager") -> "VacancySearchIndex":
+        """
+        Метод для построения индекса по данным БД (строки читаются серверным курсором пачками).
+
+        :param db_manager: Объект подключения к БД.
+        :return: Объект индекса.
+        """
+        return cls.from_rows(row for batch in db_manager.stream_rows(INDEX_QUERY) for row in batch)
+
+    @classmethod
+    def from_snapshot(cls, reader: "SnapshotReader") -> "VacancySearchIndex":
+        """
+        Метод для построения индекса по файлу снимка.
+
+        :param reader: Объект чтения снимка.
+        :return: Объект индекса.
+        """
+        employers = reader.iter_rows("employers", ["source", "emp_id", "name"])
+        names = {(source, emp_id): name for source, emp_id, name in employers}
+        index = cls.from_rows(
+            (source, vac_id, title, salary_from, salary_to, city, url, emp_id, names[(source, emp_id)])
+            for source, vac_id, title, salary_from, salary_to, city, url, emp_id in reader.iter_rows("vacancies")
+            if (source, emp_id) in names
+        )
+        # Работодатели без вакансий тоже известны снимку
+        for key, name in names.items():
+            index.__employer_names.setdefault(key, name)
+        return index
+
+    def add_employers(self, employers: List[Employer]) -> None:
+        """
+        Метод для добавления работодателей (как и в БД, сохраняется первая запись с данным ID).
+
+        :param employers: Список работодателей.
+        """
+        for emp in employers:
+            self.__employer_names.setdefault((emp.source, emp.emp_id), emp.name)
+
+    def add_vacancies(self, vacancies: List[Vacancy]) -> int:
+        """
+        Метод для инкрементального добавления вакансий в индекс.
+
+        Как и `DBManager.insert_vacancies` (ON CONFLICT DO NOTHING), уже известные вакансии пропускаются.
+        Вакансии неизвестных работодателей не индексируются, так как не попадают в JOIN отчетов: работодатели
+        новых вакансий должны быть известны индексу по строкам, из которых он построен, или по `add_employers`.
+
+        :param vacancies: Список вакансий.
+        :return: Количество добавленных вакансий.
+        """
+        added = 0
+        for vac in vacancies:
+            name = self.__employer_names.get((vac.source, vac.emp_id))
+            if name is None:
+                logger.warning(f"Вакансия '{vac.uid}' пропущена: работодатель '{vac.source}:{vac.emp_id}' не найден.")
+                continue
+            if self.__add(
+                vac.source, vac.vac_id, vac.title, vac.salary_from, vac.salary_to, vac.city, vac.url, vac.emp_id, name
+            ):
+                added += 1
+        if added:
+            self.__cache.clear()
+        logger.info(f"В индекс добавлено вакансий: {added}/{len(vacancies)}. Всего: {len(self)}.")
+        return added
+
+    def __add(
+        self,
+        source: str,
+        vac_id: int,
+        title: str,
+        salary_from: Optional[int],
+        salary_to: Optional[int],
+        city: Optional[str],
+        url: str,
+        emp_id: int,
+        employer_name: str,
+    ) -> bool:
+        """Добавляет один документ во все списки. Возвращает False, если вакансия уже есть в индексе."""
+        key = (source, vac_id)
+        if key in self.__doc_ids:
+            return False
+        self.__employer_names.setdefault((source, emp_id), employer_name)
+        doc_id = len(self.__rows)
+        self.__doc_ids[key] = doc_id
+        self.__rows.append((employer_name, title, salary_from, salary_to, url))
+        self.__keys.append(key)
+        for word in set(title.lower().split()):
+            if word not in self.__title_postings:
+                self.__title_postings[word] = array("I")
+                self.__add_word(word)
+            self.__title_postings[word].append(doc_id)
+        for token in set(tokenize(title) + tokenize(city or "")):
+            self.__token_postings.setdefault(token, array("I")).append(doc_id)
+        return True
+
+    def __add_word(self, word: str) -> None:
+        """Добавляет новое слово словаря названий в списки его n-грамм."""
+        word_id = len(self.__words)
+        self.__words.append(word)
+        for length in range(1, MAX_GRAM_LENGTH + 1):
+            for gram in grams(word, length):
+                self.__gram_postings.setdefault(gram, array("I")).append(word_id)
+
+    def __matching_words(self, keyword: str) -> List[str]:
+        """
+        Возвращает слова словаря, содержащие ключевое слово как подстроку.
+
+        Короткое ключевое слово само является n-граммой. Для длинного пересекаются списки всех его
+        n-грамм максимальной длины, а кандидаты проверяются прямым поиском подстроки.
+        """
+        words = self.__words
+        if not keyword:
+            return list(words)
+        if len(keyword) <= MAX_GRAM_LENGTH:
+            return [words[word_id] for word_id in self.__gram_postings.get(keyword, ())]
+        postings = [self.__gram_postings.get(gram, array("I")) for gram in grams(keyword, MAX_GRAM_LENGTH)]
+        return [words[word_id] for word_id in intersect(postings) if keyword in words[word_id]]
+
+    def __sorted_rows(self, doc_ids: Iterable[int]) -> List[Tuple]:
+        """
+        Возвращает строки документов, упорядоченные по `collation_key` названия, затем по (source, vac_id).
+
+        Порядок приблизительно совпадает с ORDER BY v.title, v.source, v.vac_id: сортировка БД зависит от ее локали.
+        """
+        rows, keys = self.__rows, self.__keys
+        return [
+            rows[doc_id]
+            for doc_id in sorted(doc_ids, key=lambda doc_id: (collation_key(rows[doc_id][1]), keys[doc_id]))
+        ]
+
+    def get_vacancies_with_keyword(self, keywords: List[str]) -> List[Tuple]:
+        """
+        Метод для поиска вакансий, в названии которых содержится хотя бы одно из ключевых слов.
+
+        Возвращает те же строки, что и `DBManager.get_vacancies_with_keyword` (поиск подстроки без учета
+        регистра). Ключевые слова не содержат пробелов, поэтому подстрока всегда лежит внутри одного слова
+        названия: достаточно объединить списки документов всех слов словаря, содержащих ключевое слово.
+        Слова словаря находятся по n-граммам без полного перебора. Результаты последних `CACHE_SIZE` запросов
+        кэшируются до следующего добавления вакансий.
+
+        :param keywords: Список ключевых слов для поиска в названии вакансии.
+        :return: Список вакансий.
+        """
+        key = tuple(sorted({keyword.lower() for keyword in keywords}))
+        cached = self.__cache.get(key)
+        if cached is not None:
+            self.__cache.move_to_end(key)
+            logger.info(f"Результат поиска по ключевым словам {keywords} взят из кэша.")
+            return cached
+
+        words = {word for keyword in key for word in self.__matching_words(keyword)}
+        vacancies = self.__sorted_rows(union([self.__title_postings[word] for word in words]))
+        self.__cache[key] = vacancies
+        if len(self.__cache) > CACHE_SIZE:
+            self.__cache.popitem(last=False)
+        logger.info(f"Найдено '{len(vacancies)}' вакансий в индексе по ключевым словам: {keywords}.")
+        return vacancies
+
+    def search(self, query: str, match_all: bool = True) -> List[Tuple]:
+        """
+        Метод для поиска по нормализованным словам названия и города вакансии.
+
+        :param query: Строка запроса.
+        :param match_all: True — вакансия должна содержать все слова запроса, False — хотя бы одно.
+        :return: Список вакансий, упорядоченный по названию.
+        """
+        tokens = set(tokenize(query))
+        if not tokens:
+            return []
+        postings = [self.__token_postings.get(token, array("I")) for token in tokens]
+        doc_ids = intersect(postings) if match_all else union(postings)
+        vacancies = self.__sorted_rows(doc_ids)
+        logger.info(f"Найдено '{len(vacancies)}' вакансий в индексе по запросу '{query}' (все слова: {match_all}).")
+        return vacancies
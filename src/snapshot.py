@@ -0,0 +1,421 @@
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.logger_config import add_logger
+from src.renderer import format_vacancy
+from src.utils import collation_key
+
+if TYPE_CHECKING:
+    from src.db_manager import DBManager
+
+# Настройка логирования
+logger = add_logger("snapshot.log", "snapshot")
+
+# Сигнатура файла снимка: записывается в начало и в конец файла
+MAGIC = b"DBVSNAP1"
+FOOTER_LENGTH = struct.Struct("<Q")
+FORMAT_VERSION = 2
+
+# Схема экспортируемых таблиц: (название столбца, тип). Типы: "int" — nullable int64, "str" — nullable UTF-8
+TABLES: Dict[str, List[Tuple[str, str]]] = {
+    "employers": [("source", "str"), ("emp_id", "int"), ("name", "str"), ("vac_count", "int"), ("url", "str")],
+    "vacancies": [
+        ("source", "str"),
+        ("vac_id", "int"),
+        ("title", "str"),
+        ("salary_from", "int"),
+        ("salary_to", "int"),
+        ("city", "str"),
+        ("url", "str"),
+        ("emp_id", "int"),
+    ],
+}
+
+# Значение-заполнитель для NULL в целочисленных столбцах (сам NULL хранится в маске)
+_INT_NULL = 0
+
+
+def _to_little_endian(values: array) -> array:
+    """Приводит массив к порядку байт little-endian, в котором данные хранятся в снимке."""
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _encode_int_column(values: Sequence[Optional[int]]) -> bytes:
+    """
+    Кодирует целочисленный столбец: маска NULL (1 байт на строку) + массив int64.
+
+    :param values: Значения столбца.
+    :return: Закодированный блок.
+    """
+    mask = bytes(value is None for value in values)
+    data = _to_little_endian(array("q", (_INT_NULL if value is None else value for value in values)))
+    return mask + data.tobytes()
+
+
+def _encode_str_column(values: Sequence[Optional[str]]) -> bytes:
+    """
+    Кодирует строковый столбец: маска NULL + смещения uint32 (n + 1) + общий буфер UTF-8.
+
+    :param values: Значения столбца.
+    :return: Закодированный блок.
+    """
+    mask = bytes(value is None for value in values)
+    offsets = array("I", [0])
+    blob = bytearray()
+    for value in values:
+        if value is not None:
+            blob += value.encode("UTF-8")
+        offsets.append(len(blob))
+    return mask + _to_little_endian(offsets).tobytes() + bytes(blob)
+
+
+def _decode_int_column(buffer: memoryview, rows: int) -> List[Optional[int]]:
+    """Декодирует целочисленный столбец. Массив int64 читается через `cast` без копирования буфера."""
+    mask = buffer[:rows]
+    with buffer[rows : rows + rows * 8].cast("q") as data:
+        if sys.byteorder == "big":
+            values = _to_little_endian(array("q", data)).tolist()
+        else:
+            values = data.tolist()
+    return [None if mask[i] else values[i] for i in range(rows)]
+
+
+def _decode_str_column(buffer: memoryview, rows: int) -> List[Optional[str]]:
+    """Декодирует строковый столбец. Смещения читаются через `cast`, строки — срезами общего буфера."""
+    mask = buffer[:rows]
+    with buffer[rows : rows + (rows + 1) * 4].cast("I") as raw_offsets:
+        offsets = raw_offsets.tolist() if sys.byteorder == "little" else _to_little_endian(array("I", raw_offsets))
+    blob = buffer[rows + (rows + 1) * 4 :]
+    return [None if mask[i] else str(blob[offsets[i] : offsets[i + 1]], "UTF-8") for i in range(rows)]
+
+
+_ENCODERS: Dict[str, Callable[[Sequence[Any]], bytes]] = {"int": _encode_int_column, "str": _encode_str_column}
+_DECODERS: Dict[str, Callable[[memoryview, int], List[Any]]] = {"int": _decode_int_column, "str": _decode_str_column}
+
+
+def _avg_salary_value(salary_from: Optional[int], salary_to: Optional[int]) -> Optional[int]:
+    """Повторяет выражение CASE из `DBManager.get_avg_salary` (включая целочисленное деление PostgreSQL)."""
+    if salary_from is not None and salary_to is not None:
+        return (salary_from + salary_to) // 2
+    if salary_from is not None:
+        return salary_from
+    return salary_to
+
+
+class SnapshotWriter:
+    """Класс для записи колоночного снимка таблиц в файл."""
+
+    def __init__(self, path: str, compress: bool = True) -> None:
+        """
+        Инициализация записи снимка.
+
+        Данные сначала пишутся во временный файл, который заменяет целевой только после успешного `close()`.
+
+        :param path: Путь к файлу снимка.
+        :param compress: Сжимать ли блоки столбцов zlib. Без сжатия чтение выполняется без копирования.
+        """
+        self.path = path
+        self.compress = compress
+        self.__tmp_path = f"{path}.tmp"
+        self.__file = open(self.__tmp_path, "wb")
+        self.__file.write(MAGIC)
+        self.__meta: Dict = {
+            "version": FORMAT_VERSION,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "compression": "zlib" if compress else "none",
+            "tables": {},
+        }
+        logger.info(f"Создан объект класса 'SnapshotWriter' для файла '{path}'. Сжатие: {compress}.")
+
+    def __enter__(self) -> "SnapshotWriter":
+        return self
+
+    def __exit__(self, exc_type: Optional[type], exc: Optional[BaseException], tb: object) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write_table(self, name: str, columns: List[Tuple[str, str]], batches: Iterable[List[Tuple]]) -> int:
+        """
+        Метод для записи таблицы. Каждая пачка строк становится отдельной группой строк (row group),
+        поэтому в памяти одновременно находится только одна пачка.
+
+        :param name: Название таблицы.
+        :param columns: Список столбцов в виде (название, тип).
+        :param batches: Итератор по пачкам строк.
+        :return: Количество записанных строк.
+        """
+        logger.info(f"Запущен метод 'write_table' для таблицы '{name}'.")
+        table: Dict = {
+            "columns": [{"name": col, "type": col_type} for col, col_type in columns],
+            "rows": 0,
+            "row_groups": [],
+        }
+        for batch in batches:
+            if not batch:
+                continue
+            chunks = []
+            for index, (_, col_type) in enumerate(columns):
+                raw = _ENCODERS[col_type]([row[index] for row in batch])
+                payload = zlib.compress(raw, 6) if self.compress else raw
+                chunks.append({"offset": self.__file.tell(), "length": len(payload), "raw_length": len(raw)})
+                self.__file.write(payload)
+            table["row_groups"].append({"rows": len(batch), "chunks": chunks})
+            table["rows"] += len(batch)
+        self.__meta["tables"][name] = table
+        logger.info(f"Таблица '{name}' записана: строк — {table['rows']}, групп — {len(table['row_groups'])}.")
+        return int(table["rows"])
+
+    def close(self) -> None:
+        """Метод для записи метаданных и завершения файла снимка."""
+        footer = json.dumps(self.__meta, ensure_ascii=False).encode("UTF-8")
+        self.__file.write(footer)
+        self.__file.write(FOOTER_LENGTH.pack(len(footer)))
+        self.__file.write(MAGIC)
+        self.__file.close()
+        os.replace(self.__tmp_path, self.path)
+        logger.info(f"Снимок '{self.path}' успешно записан.")
+
+    def abort(self) -> None:
+        """Метод для отмены записи и удаления временного файла."""
+        self.__file.close()
+        if os.path.exists(self.__tmp_path):
+            os.remove(self.__tmp_path)
+        logger.warning(f"Запись снимка '{self.path}' отменена.")
+
+
+def export_snapshot(db_manager: "DBManager", path: str, batch_size: int = 50000, compress: bool = True) -> Dict:
+    """
+    Функция для экспорта таблиц employers и vacancies в колоночный снимок.
+
+    Строки читаются серверным курсором (`DBManager.stream_rows`) и сразу записываются группами,
+    поэтому экспорт миллионов строк выполняется в ограниченном объеме памяти.
+
+    :param db_manager: Объект подключения к БД.
+    :param path: Путь к файлу снимка.
+    :param batch_size: Количество строк в одной группе.
+    :param compress: Сжимать ли блоки столбцов.
+    :return: Словарь с количеством выгруженных строк по таблицам.
+    """
+    logger.info(f"Вызов функции 'export_snapshot'. Файл: '{path}'.")
+    counts = {}
+    with SnapshotWriter(path, compress=compress) as writer:
+        for table, columns in TABLES.items():
+            names = [col for col, _ in columns]
+            query = f"SELECT {', '.join(names)} FROM {table} ORDER BY {names[0]}, {names[1]};"
+            counts[table] = writer.write_table(table, columns, db_manager.stream_rows(query, batch_size))
+    logger.info(f"Экспорт завершен: {counts}.")
+    return counts
+
+
+class SnapshotReader:
+    """
+    Класс для офлайн-чтения снимка через отображение файла в память (mmap).
+
+    Поддерживает те же отчеты, что и `DBManager`, и возвращает те же строки в том же формате.
+    Строки сортируются по `collation_key`, поэтому порядок совпадает с порядком БД приблизительно.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Инициализация чтения снимка.
+
+        :param path: Путь к файлу снимка.
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            self.__mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        size = len(self.__mm)
+        tail = len(MAGIC) + FOOTER_LENGTH.size
+        if size < len(MAGIC) + tail or self.__mm[: len(MAGIC)] != MAGIC or self.__mm[-len(MAGIC) :] != MAGIC:
+            self.__mm.close()
+            raise ValueError(f"Файл '{path}' не является снимком DB Vacancy Manager.")
+        (footer_length,) = FOOTER_LENGTH.unpack_from(self.__mm, size - tail)
+        footer_start = size - tail - footer_length
+        self.meta = json.loads(self.__mm[footer_start : size - tail].decode("UTF-8"))
+        if self.meta.get("version") != FORMAT_VERSION:
+            self.__mm.close()
+            raise ValueError(f"Неподдерживаемая версия снимка: {self.meta.get('version')}.")
+        self.__compressed = self.meta["compression"] == "zlib"
+        logger.info(f"Снимок '{path}' открыт. Создан: {self.meta['created_at']}.")
+
+    def __enter__(self) -> "SnapshotReader":
+        return self
+
+    def __exit__(self, exc_type: Optional[type], exc: Optional[BaseException], tb: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Метод для закрытия отображения файла."""
+        self.__mm.close()
+        logger.info(f"Снимок '{self.path}' закрыт.")
+
+    def count_rows(self, table: str) -> int:
+        """Метод для получения количества строк таблицы в снимке."""
+        return int(self.meta["tables"][table]["rows"])
+
+    def iter_rows(self, table: str, columns: Optional[List[str]] = None) -> Iterator[Tuple]:
+        """
+        Метод для построчного чтения таблицы. Декодируются только запрошенные столбцы
+        и только одна группа строк за раз.
+
+        :param table: Название таблицы.
+        :param columns: Список столбцов (по умолчанию — все).
+        :return: Итератор по строкам.
+        """
+        meta = self.meta["tables"][table]
+        names = [col["name"] for col in meta["columns"]]
+        selected = [names.index(col) for col in (columns or names)]
+        for group in meta["row_groups"]:
+            decoded = []
+            for index in selected:
+                chunk = group["chunks"][index]
+                decoder = _DECODERS[meta["columns"][index]["type"]]
+                # Представление отображения создается на время декодирования одного блока и освобождается до yield,
+                # поэтому незавершенный итератор не мешает закрыть снимок
+                with memoryview(self.__mm) as view, view[chunk["offset"] : chunk["offset"] + chunk["length"]] as raw:
+                    if self.__compressed:
+                        with memoryview(zlib.decompress(raw)) as buffer:
+                            decoded.append(decoder(buffer, group["rows"]))
+                    else:
+                        decoded.append(decoder(raw, group["rows"]))
+            yield from zip(*decoded)
+
+    def __employer_names(self) -> Dict[Tuple[str, int], str]:
+        """Возвращает словарь (source, emp_id) -> название компании."""
+        rows = self.iter_rows("employers", ["source", "emp_id", "name"])
+        return {(source, emp_id): name for source, emp_id, name in rows}
+
+    def __joined_vacancies(self) -> Iterator[Tuple]:
+        """Возвращает вакансии, соединенные с работодателями (аналог JOIN employers USING (source, emp_id))."""
+        names = self.__employer_names()
+        for source, title, salary_from, salary_to, url, emp_id in self.iter_rows(
+            "vacancies", ["source", "title", "salary_from", "salary_to", "url", "emp_id"]
+        ):
+            if (source, emp_id) in names:
+                yield names[(source, emp_id)], title, salary_from, salary_to, url
+
+    def get_companies_and_vacancies_count(self) -> List[Tuple]:
+        """Метод для получения списка всех компаний и количество вакансий у каждой компании."""
+        logger.info(f"Запущен метод 'get_companies_and_vacancies_count' в классе '{type(self).__name__}'.")
+        per_employer: Dict[Tuple[str, int], int] = {}
+        for key in self.iter_rows("vacancies", ["source", "emp_id"]):
+            per_employer[key] = per_employer.get(key, 0) + 1
+        per_name: Dict[str, int] = {}
+        for key, name in self.__employer_names().items():
+            per_name[name] = per_name.get(name, 0) + per_employer.get(key, 0)
+        return sorted(per_name.items(), key=lambda item: item[1])
+
+    def get_all_vacancies(self) -> List[Tuple]:
+        """Метод для получения списка всех вакансий с указанием компании, зарплаты и ссылки."""
+        logger.info(f"Запущен метод 'get_all_vacancies' в классе '{type(self).__name__}'.")
+        vacancies = sorted(self.__joined_vacancies(), key=lambda row: collation_key(row[0]))
+        logger.info(f"Всего получено '{len(vacancies)}' вакансий.")
+        return vacancies
+
+    def get_avg_salary(self) -> float:
+        """Метод для получения средней зарплаты по всем вакансиям."""
+        logger.info(f"Запущен метод 'get_avg_salary' в классе '{type(self).__name__}'.")
+        total, count = 0, 0
+        for salary_from, salary_to in self.iter_rows("vacancies", ["salary_from", "salary_to"]):
+            value = _avg_salary_value(salary_from, salary_to)
+            if value is not None:
+                total += value
+                count += 1
+        avg_salary = total / count if count else 0.0
+        logger.info(f"Средняя зарплата по вакансиям: {avg_salary}.")
+        return round(avg_salary, 2)
+
+    def get_vacancies_with_higher_salary(self) -> List[Tuple]:
+        """Метод для получения списка вакансий с зарплатой выше средней по всем вакансиям."""
+        logger.info(f"Запущен метод 'get_vacancies_with_higher_salary' в классе '{type(self).__name__}'.")
+        avg_salary = self.get_avg_salary()
+        vacancies = [
+            row
+            for row in self.__joined_vacancies()
+            if (row[2] is not None and row[2] > avg_salary) or (row[3] is not None and row[3] > avg_salary)
+        ]
+        # ORDER BY salary_from DESC, salary_to DESC, source DESC, vac_id DESC: в PostgreSQL NULL при DESC идет первым.
+        # Строки снимка упорядочены по (source, vac_id), а сортировка устойчива, поэтому достаточно развернуть список
+        vacancies.reverse()
+        vacancies.sort(key=lambda row: (row[3] is None, row[3] or 0), reverse=True)
+        vacancies.sort(key=lambda row: (row[2] is None, row[2] or 0), reverse=True)
+        logger.info(f"Получено '{len(vacancies)}' вакансий с зарплатой выше средней ({avg_salary}).")
+        return vacancies
+
+    def get_vacancies_with_keyword(self, keywords: List[str]) -> List[Tuple]:
+        """
+        Метод для получения списка вакансий, в названии которых содержатся ключевые слова.
+
+        :param keywords: Список ключевых слов для поиска в названии вакансии.
+        :return: Список вакансий.
+        """
+        logger.info(
+            f"Запущен метод 'get_vacancies_with_keyword' в классе '{type(self).__name__}' с параметром: '{keywords}'."
+        )
+        lowered = [keyword.lower() for keyword in keywords]
+        vacancies = sorted(
+            (row for row in self.__joined_vacancies() if any(keyword in row[1].lower() for keyword in lowered)),
+            key=lambda row: collation_key(row[1]),
+        )
+        logger.info(f"Найдено '{len(vacancies)}' вакансий по ключевым словам: {keywords}.")
+        return vacancies
+
+
+def main() -> None:
+    """Точка входа для экспорта снимка и офлайн-отчетов: `python -m src.snapshot {export,report} ...`."""
+    parser = argparse.ArgumentParser(description="Экспорт и офлайн-чтение снимков БД вакансий.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = commands.add_parser("export", help="Выгрузить таблицы из PostgreSQL в файл снимка.")
+    export_parser.add_argument("path", help="Путь к файлу снимка.")
+    export_parser.add_argument("--batch-size", type=int, default=50000, help="Количество строк в группе.")
+    export_parser.add_argument("--no-compress", action="store_true", help="Не сжимать столбцы.")
+
+    report_parser = commands.add_parser("report", help="Построить отчет по файлу снимка без БД.")
+    report_parser.add_argument("path", help="Путь к файлу снимка.")
+    report_parser.add_argument("report", choices=["companies", "all", "avg", "higher", "keyword"])
+    report_parser.add_argument("keywords", nargs="*", help="Ключевые слова для отчета 'keyword'.")
+
+    args = parser.parse_args()
+
+    if args.command == "export":
+        from src.db_manager import DBManager
+
+        db_manager = DBManager()
+        try:
+            counts = export_snapshot(db_manager, args.path, args.batch_size, not args.no_compress)
+        finally:
+            db_manager.close_conn()
+        print(f"✅  Снимок '{args.path}' сохранен: {counts}.")
+        return
+
+    with SnapshotReader(args.path) as reader:
+        if args.report == "companies":
+            for name, count in reader.get_companies_and_vacancies_count():
+                print(f"➢ {name}: {count} вакансий.")
+        elif args.report == "avg":
+            print(f"➢ Средняя зарплата по вакансиям: {reader.get_avg_salary()} руб.")
+        else:
+            if args.report == "all":
+                vacancies = reader.get_all_vacancies()
+            elif args.report == "higher":
+                vacancies = reader.get_vacancies_with_higher_salary()
+            else:
+                vacancies = reader.get_vacancies_with_keyword(args.keywords)
+            sys.stdout.write("".join(f"{format_vacancy(vacancy)}\n" for vacancy in vacancies))
+
+
+if __name__ == "__main__":
+    main()
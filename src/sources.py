@@ -0,0 +1,236 @@
+import argparse
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Type
+
+from src.base import VacancyAPI
+from src.external_api import HeadHunterAPI
+from src.logger_config import add_logger
+from src.models import Employer, Vacancy
+
+# Настройка логирования
+logger = add_logger("sources.log", "sources")
+
+path_project = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Реестр плагинов источников: код источника -> класс клиента API
+SOURCE_PLUGINS: Dict[str, Type[VacancyAPI]] = {
+    HeadHunterAPI.source: HeadHunterAPI,
+}
+
+# Настройки источников по умолчанию (если в user_settings.json нет раздела "sources")
+DEFAULT_SOURCES = {"hh": {"enabled": True, "concurrency": 4, "rate_limit": 5}}
+
+
+def register_source_plugin(api_class: Type[VacancyAPI]) -> Type[VacancyAPI]:
+    """
+    Функция для регистрации класса источника в реестре плагинов (можно использовать как декоратор).
+
+    :param api_class: Класс клиента API с заполненным атрибутом `source`.
+    :return: Тот же класс.
+    """
+    if not api_class.source:
+        raise ValueError(f"У класса '{api_class.__name__}' не задан код источника.")
+    SOURCE_PLUGINS[api_class.source] = api_class
+    logger.info(f"Зарегистрирован источник '{api_class.source}' ({api_class.__name__}).")
+    return api_class
+
+
+def load_source_settings() -> Dict[str, Dict]:
+    """
+    Функция для загрузки настроек источников из раздела "sources" файла user_settings.json.
+
+    :return: Словарь код источника -> настройки (enabled, concurrency, rate_limit).
+    """
+    settings_path = os.path.join(path_project, "user_settings.json")
+    try:
+        with open(settings_path, encoding="UTF-8") as file:
+            sources = json.load(file).get("sources")
+        logger.info("Настройки источников загружены из 'user_settings.json'.")
+    except FileNotFoundError:
+        logger.warning("Файл 'user_settings.json' не найден. Используются настройки источников по умолчанию.")
+        sources = None
+    return sources or DEFAULT_SOURCES
+
+
+class RateLimiter:
+    """Класс потокобезопасного ограничителя частоты запросов (token bucket)."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """
+        Инициализация ограничителя.
+
+        :param rate: Максимальное среднее количество запросов в секунду.
+        :param burst: Количество запросов, которые можно отправить подряд без ожидания.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.__tokens = float(burst)
+        self.__updated = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Метод для получения разрешения на запрос. При исчерпании лимита поток ждет своей очереди."""
+        with self.__lock:
+            now = time.monotonic()
+            self.__tokens = min(self.burst, self.__tokens + (now - self.__updated) * self.rate)
+            self.__updated = now
+            self.__tokens -= 1
+            wait = -self.__tokens / self.rate if self.__tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+
+class SourceRegistry:
+    """Класс реестра источников вакансий с параллельным опросом всех источников."""
+
+    def __init__(self) -> None:
+        """Инициализация пустого реестра."""
+        self.__sources: Dict[str, Tuple[VacancyAPI, int]] = {}
+        logger.info("Создан объект класса 'SourceRegistry'.")
+
+    def __enter__(self) -> "SourceRegistry":
+        return self
+
+    def __exit__(self, exc_type: Optional[type], exc: Optional[BaseException], tb: object) -> None:
+        self.close()
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Dict]) -> "SourceRegistry":
+        """
+        Метод для создания реестра по настройкам источников.
+
+        :param settings: Словарь код источника -> настройки (enabled, concurrency, rate_limit).
+        :return: Объект реестра.
+        """
+        registry = cls()
+        for source, options in settings.items():
+            if not options.get("enabled", True):
+                continue
+            if source not in SOURCE_PLUGINS:
+                logger.error(f"Источник '{source}' не зарегистрирован и будет пропущен.")
+                continue
+            registry.register(SOURCE_PLUGINS[source](), options.get("concurrency", 1), options.get("rate_limit"))
+        return registry
+
+    @property
+    def sources(self) -> List[str]:
+        """Геттер для получения списка кодов подключенных источников."""
+        return list(self.__sources)
+
+    def register(self, api: VacancyAPI, concurrency: int = 1, rate_limit: Optional[float] = None) -> None:
+        """
+        Метод для подключения источника.
+
+        :param api: Клиент API источника.
+        :param concurrency: Количество одновременных запросов вакансий к источнику.
+        :param rate_limit: Максимальное количество запросов в секунду (None или 0 — без ограничения).
+        """
+        api.rate_limiter = RateLimiter(rate_limit, burst=concurrency) if rate_limit else None
+        self.__sources[api.source] = (api, max(1, concurrency))
+        logger.info(f"Подключен источник '{api.source}': потоков — {concurrency}, лимит — {rate_limit} запр./с.")
+
+    def close(self) -> None:
+        """Метод для освобождения ресурсов всех подключенных источников."""
+        for api, _ in self.__sources.values():
+            api.close()
+        logger.info("Источники отключены.")
+
+    def fetch(self) -> Tuple[List[Employer], List[Vacancy], Dict[str, Dict]]:
+        """
+        Метод для параллельного получения данных из всех источников и приведения их к общей схеме.
+
+        :return: Кортеж (работодатели, вакансии, статистика по источникам и итоговая под ключом 'total').
+        """
+        logger.info(f"Запущен метод 'fetch'. Источники: {self.sources}.")
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, len(self.__sources)), thread_name_prefix="source") as pool:
+            results = list(pool.map(lambda item: self.__fetch_source(*item), self.__sources.values()))
+
+        employers: List[Employer] = []
+        vacancies: List[Vacancy] = []
+        stats: Dict[str, Dict] = {}
+        for (api, _), (employers_data, vacancies_data, elapsed) in zip(self.__sources.values(), results):
+            source_employers = api.normalize_employers(employers_data)
+            source_vacancies = api.normalize_vacancies(vacancies_data)
+            employers.extend(source_employers)
+            vacancies.extend(source_vacancies)
+            stats[api.source] = {
+                "employers": len(source_employers),
+                "vacancies": len(source_vacancies),
+                "seconds": round(elapsed, 2),
+                "vacancies_per_second": round(len(source_vacancies) / elapsed, 1) if elapsed else 0.0,
+            }
+
+        elapsed = time.perf_counter() - started
+        stats["total"] = {
+            "employers": len(employers),
+            "vacancies": len(vacancies),
+            "seconds": round(elapsed, 2),
+            "vacancies_per_second": round(len(vacancies) / elapsed, 1) if elapsed else 0.0,
+        }
+        logger.info(f"Данные из источников получены: {stats}.")
+        return employers, vacancies, stats
+
+    @staticmethod
+    def __fetch_source(api: VacancyAPI, concurrency: int) -> Tuple[List[Dict], List[Dict], float]:
+        """Загружает работодателей источника, затем их вакансии в `concurrency` потоков."""
+        started = time.perf_counter()
+        try:
+            employers_data = api.get_employers()
+        except Exception as e:
+            logger.error(f"Ошибка при получении работодателей из источника '{api.source}': {e}.", exc_info=True)
+            return [], [], time.perf_counter() - started
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f"source-{api.source}") as pool:
+            pages = list(pool.map(lambda employer: SourceRegistry.__fetch_vacancies(api, employer), employers_data))
+        vacancies_data = [item for page in pages for item in page]
+        return employers_data, vacancies_data, time.perf_counter() - started
+
+    @staticmethod
+    def __fetch_vacancies(api: VacancyAPI, employer: Dict) -> List[Dict]:
+        """Загружает вакансии одного работодателя. Ошибка пропускает только этого работодателя, а не весь источник."""
+        try:
+            return api.get_vacancies(int(employer["id"]))
+        except Exception as e:
+            logger.error(
+                f"Вакансии работодателя {employer!r} из источника '{api.source}' пропущены из-за ошибки: {e}.",
+                exc_info=True,
+            )
+            return []
+
+
+def main() -> None:
+    """Точка входа для замера пропускной способности источников без БД: `python -m src.sources fixture`."""
+    # Тестовый источник доступен только при замерах: он запускает собственный локальный сервер
+    from src.fixture_api import FixtureAPI
+
+    register_source_plugin(FixtureAPI)
+    parser = argparse.ArgumentParser(description="Параллельная загрузка вакансий из нескольких источников.")
+    parser.add_argument("sources", nargs="*", help="Коды источников (по умолчанию — из user_settings.json).")
+    parser.add_argument("--concurrency", type=int, help="Количество потоков на источник.")
+    parser.add_argument("--rate-limit", type=float, help="Лимит запросов в секунду на источник.")
+    args = parser.parse_args()
+
+    settings = load_source_settings()
+    if args.sources:
+        settings = {source: {**settings.get(source, {}), "enabled": True} for source in args.sources}
+    for options in settings.values():
+        if args.concurrency is not None:
+            options["concurrency"] = args.concurrency
+        if args.rate_limit is not None:
+            options["rate_limit"] = args.rate_limit
+
+    with SourceRegistry.from_settings(settings) as registry:
+        _, _, stats = registry.fetch()
+    for source, stat in stats.items():
+        print(
+            f"➢ {source}: работодателей — {stat['employers']}, вакансий — {stat['vacancies']}, "
+            f"{stat['seconds']} с ({stat['vacancies_per_second']} вакансий/с)"
+        )
+
+
+if __name__ == "__main__":
+    main()
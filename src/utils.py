@@ -1,19 +1,34 @@
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from tqdm import tqdm
 
 from src.logger_config import add_logger
-from src.models import Employer, Vacancy
+from src.models import DEFAULT_SOURCE, Employer, Vacancy
 
 # Настройка логирования
 logger = add_logger("utils.log", "utils")
 
 
-def parse_employers(employers_data: List[Dict]) -> List[Employer]:
+def collation_key(text: str) -> Tuple[str, str]:
+    """
+    Функция для получения ключа сортировки строк, приближенного к порядку сортировки PostgreSQL.
+
+    Правила сортировки БД (ru_RU.UTF-8, en_US.UTF-8) в первую очередь не учитывают регистр, поэтому
+    строки сравниваются в `casefold()`, а при равенстве — как есть. Совпадение с порядком БД приблизительное:
+    например, знаки препинания PostgreSQL может учитывать иначе.
+
+    :param text: Строка.
+    :return: Ключ сортировки.
+    """
+    return text.casefold(), text
+
+
+def parse_employers(employers_data: List[Dict], source: str = DEFAULT_SOURCE) -> List[Employer]:
     """
     Функция для парсинга данных работодателей из API HeadHunter и преобразует их в список объектов Employer.
 
     :param employers_data: Список словарей с данными работодателей из API.
+    :param source: Код источника данных.
     :return: Список объектов работодателей.
     """
     logger.info(f"Вызов функции 'parse_employers'. Количество полученных работодателей: {len(employers_data)}.")
@@ -29,10 +44,11 @@ def parse_employers(employers_data: List[Dict]) -> List[Employer]:
                 name=item.get("name"),
                 vac_count=item.get("open_vacancies"),
                 url=item.get("alternate_url"),
+                source=source,
             )
             employers_list.append(employer)
 
-        except (KeyError, ValueError, AttributeError) as e:
+        except (KeyError, ValueError, TypeError, AttributeError) as e:
             logger.error(f"Ошибка при обработке работодателя ({item.get('id')}): {e}.")
             continue
 
@@ -40,11 +56,12 @@ def parse_employers(employers_data: List[Dict]) -> List[Employer]:
     return employers_list
 
 
-def parse_vacancies(vacancies_data: List[Dict]) -> List[Vacancy]:
+def parse_vacancies(vacancies_data: List[Dict], source: str = DEFAULT_SOURCE) -> List[Vacancy]:
     """
     Функция для парсинга данных вакансий из API HeadHunter и преобразует их в список объектов Vacancy.
 
     :param vacancies_data: Список словарей с данными вакансий из API.
+    :param source: Код источника данных.
     :return: Список объектов вакансий.
     """
     logger.info(f"Вызов функции 'vacancies_data'. Количество полученных вакансий: {len(vacancies_data)}.")
@@ -63,10 +80,11 @@ def parse_vacancies(vacancies_data: List[Dict]) -> List[Vacancy]:
                 emp_id=int((item.get("employer") or {}).get("id")),
                 city=(item.get("area") or {}).get("name"),
                 url=item.get("alternate_url"),
+                source=source,
             )
             vacancy_list.append(vacancy)
 
-        except (KeyError, ValueError, AttributeError) as e:
+        except (KeyError, ValueError, TypeError, AttributeError) as e:
             logger.error(f"Ошибка при обработке вакансии ({item.get('id')}): {e}.")
             continue
 
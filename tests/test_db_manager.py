@@ -0,0 +1,41 @@
+from src.db_manager import PagedQuery
+
+QUERY = PagedQuery(
+    columns="v.title",
+    tables="vacancies v",
+    where="title ILIKE %s",
+    params=("%python%",),
+    order_by=("v.title", "v.source", "v.vac_id"),
+)
+
+
+def test_sql() -> None:
+    assert QUERY.sql() == (
+        "SELECT v.title FROM vacancies v WHERE (title ILIKE %s) ORDER BY v.title, v.source, v.vac_id;",
+        ("%python%",),
+    )
+
+
+def test_count_sql() -> None:
+    assert QUERY.count_sql() == ("SELECT COUNT(*) FROM vacancies v WHERE (title ILIKE %s);", ("%python%",))
+
+
+def test_first_page_sql() -> None:
+    sql, params = QUERY.page_sql(21)
+    assert sql == (
+        "SELECT v.title, v.title, v.source, v.vac_id FROM vacancies v WHERE (title ILIKE %s) "
+        "ORDER BY v.title, v.source, v.vac_id LIMIT %s;"
+    )
+    assert params == ("%python%", 21)
+
+
+def test_next_page_sql_compares_key() -> None:
+    sql, params = QUERY.page_sql(21, ("Python", "hh", 7))
+    assert "WHERE (title ILIKE %s) AND (v.title, v.source, v.vac_id) > (%s, %s, %s)" in sql
+    assert params == ("%python%", "Python", "hh", 7, 21)
+
+
+def test_descending_page_sql() -> None:
+    sql, _ = QUERY._replace(where="", params=(), descending=True).page_sql(21, ("Python", "hh", 7))
+    assert "WHERE (v.title, v.source, v.vac_id) < (%s, %s, %s)" in sql
+    assert "ORDER BY v.title DESC, v.source DESC, v.vac_id DESC LIMIT %s;" in sql
@@ -0,0 +1,131 @@
+from datetime import date
+from typing import Any, List, Optional, Tuple
+
+import pytest
+
+from src import history
+from src.history import VacancyHistoryManager, partition_name, partition_week, retention_cutoff, week_start
+from src.models import Vacancy
+
+
+class FakeCursor:
+    """Курсор, записывающий запросы и возвращающий заранее заданные строки."""
+
+    def __init__(self, connection: "FakeConnection") -> None:
+        self.connection = connection
+        self.rows: List[Tuple] = []
+
+    def __enter__(self) -> "FakeCursor":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        pass
+
+    def execute(self, query: str, params: Tuple = ()) -> None:
+        self.connection.queries.append((" ".join(query.split()), params))
+        self.rows = self.connection.respond(query)
+
+    def executemany(self, query: str, params: List[Tuple]) -> None:
+        self.connection.queries.append((" ".join(query.split()), tuple(params)))
+
+    def fetchall(self) -> List[Tuple]:
+        return self.rows
+
+    def fetchone(self) -> Optional[Tuple]:
+        return self.rows[0] if self.rows else None
+
+
+class FakeConnection:
+    """Соединение, отвечающее на запросы списка партиций и свернутых недель."""
+
+    def __init__(self, partitions: List[str], compacted: bool = False) -> None:
+        self.partitions = partitions
+        self.compacted = compacted
+        self.queries: List[Tuple[str, Any]] = []
+
+    def __enter__(self) -> "FakeConnection":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        pass
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self)
+
+    def respond(self, query: str) -> List[Tuple]:
+        if "pg_inherits" in query:
+            return [(name,) for name in self.partitions]
+        if "FROM vacancy_history_weekly WHERE week_start" in query:
+            return [(1,)] if self.compacted else []
+        return []
+
+
+class FakeDBManager:
+    """Объект подключения, передающий менеджеру истории поддельное соединение."""
+
+    def __init__(self, conn: FakeConnection) -> None:
+        self.conn = conn
+
+
+def test_week_start() -> None:
+    assert week_start(date(2024, 5, 13)) == date(2024, 5, 13)
+    assert week_start(date(2024, 5, 19)) == date(2024, 5, 13)
+    assert week_start(date(2024, 1, 3)) == date(2024, 1, 1)
+    assert week_start(date(2023, 1, 1)) == date(2022, 12, 26)
+
+
+def test_partition_name_round_trip() -> None:
+    name = partition_name(date(2024, 3, 1))
+    assert name == "vacancy_history_w20240226"
+    assert history.PARTITION_PATTERN.match(name)
+    assert partition_week(name) == date(2024, 2, 26)
+    assert partition_week("vacancy_history_weekly") is None
+    assert partition_week("vacancy_history_w2024022") is None
+
+
+def test_retention_cutoff() -> None:
+    assert retention_cutoff(0, date(2024, 5, 15)) == date(2024, 5, 13)
+    assert retention_cutoff(26, date(2024, 5, 15)) == date(2023, 11, 13)
+
+
+def test_apply_retention_drops_only_weeks_before_cutoff() -> None:
+    cutoff = retention_cutoff(2)
+    kept, old = partition_name(cutoff), partition_name(date(cutoff.year - 1, 6, 1))
+    conn = FakeConnection([kept, "vacancy_history_default", old])
+    assert VacancyHistoryManager(FakeDBManager(conn)).apply_retention(keep_weeks=2) == [old]  # type: ignore[arg-type]
+    statements = [query for query, _ in conn.queries]
+    assert f"DROP TABLE {old};" in statements
+    assert f"DROP TABLE {kept};" not in statements
+    assert any(query.startswith("INSERT INTO vacancy_history_weekly") for query in statements)
+
+
+def test_record_snapshot_stores_salaries_as_vacancies_table() -> None:
+    conn = FakeConnection([])
+    vacancy = Vacancy(1, "Python", None, 200000, 5, "Москва", "u")
+    VacancyHistoryManager(FakeDBManager(conn)).record_snapshot([vacancy], date(2024, 5, 15))  # type: ignore[arg-type]
+    _, rows = conn.queries[-1]
+    assert rows == ((date(2024, 5, 15), "hh", 1, 5, 0, 200000),)
+
+
+def test_record_snapshot_rejects_compacted_week() -> None:
+    conn = FakeConnection([], compacted=True)
+    manager = VacancyHistoryManager(FakeDBManager(conn))  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        manager.record_snapshot([], date(2020, 1, 1))
+    assert not any("CREATE TABLE" in query for query, _ in conn.queries)
+
+
+def test_weekly_avg_salary_query() -> None:
+    sql, params = history.weekly_avg_salary_query(date(2024, 5, 15), date(2024, 5, 22))
+    assert "FROM vacancy_history WHERE snapshot_date >= %s AND snapshot_date < %s" in " ".join(sql.split())
+    assert params == (date(2024, 5, 13), date(2024, 5, 27), date(2024, 5, 13), date(2024, 5, 27))
+
+    sql, params = history.weekly_avg_salary_query(date(2024, 5, 15), date(2024, 5, 15), emp_id=7, source="fixture")
+    assert sql.count("AND source = %s AND emp_id = %s") == 2
+    assert params == (date(2024, 5, 13), date(2024, 5, 20), "fixture", 7) * 2
+
+
+def test_vacancy_count_trend_query() -> None:
+    sql, params = history.vacancy_count_trend_query(date(2024, 5, 1), date(2024, 5, 31))
+    assert "WHERE h.snapshot_date >= %s AND h.snapshot_date <= %s" in sql
+    assert params == (date(2024, 5, 1), date(2024, 5, 31))
@@ -0,0 +1,133 @@
+import io
+from typing import Iterator, List, Optional, Tuple
+
+import pytest
+
+from src.renderer import ResultPager
+
+ROWS = [
+    (f"Компания {number}", f"Вакансия {number}", None, None, f"https://hh.ru/vacancy/{number}") for number in range(45)
+]
+
+
+def make_pager(rows: List[Tuple], events: List[str], output: io.StringIO) -> ResultPager:
+    """Создает постраничный вывод, который записывает ключи запрошенных страниц и момент подсчета строк."""
+
+    def fetch_page(limit: int, after: Optional[Tuple]) -> Tuple[List[Tuple], Optional[Tuple]]:
+        events.append(f"page after {after}")
+        start = after[0] + 1 if after else 0
+        page = rows[start : start + limit]
+        return page, (start + limit - 1,) if start + limit < len(rows) else None
+
+    def count() -> int:
+        events.append(f"count after {len(output.getvalue().splitlines())} lines")
+        return len(rows)
+
+    return ResultPager(fetch_page, count, lambda row: row[1], page_size=20, output=output)
+
+
+def feed(monkeypatch: pytest.MonkeyPatch, commands: List[str]) -> None:
+    """Подменяет ввод пользователя последовательностью команд."""
+    answers: Iterator[str] = iter(commands)
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+
+
+class CountingOutput(io.StringIO):
+    """Поток вывода, считающий количество записей."""
+
+    writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return super().write(text)
+
+
+def test_first_page_is_written_before_count() -> None:
+    events: List[str] = []
+    output = CountingOutput()
+    pager = make_pager(ROWS, events, output)
+    assert pager.render(1) == 20
+    assert events == ["page after None", "count after 22 lines"]
+    assert output.writes == 1
+    assert output.getvalue().splitlines()[-1].startswith("Страница 1. ")
+
+    pager.render(2)
+    assert output.writes == 2
+    assert "Страница 2 из 3 (всего: 45)" in output.getvalue()
+
+
+def test_pages_are_fetched_by_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    events: List[str] = []
+    output = io.StringIO()
+    pager = make_pager(ROWS, events, output)
+    feed(monkeypatch, ["n", "n", "p", "1", "n", "q"])
+    pager.browse()
+    pages = [event for event in events if event.startswith("page")]
+    assert pages == [
+        "page after None",
+        "page after (19,)",
+        "page after (39,)",
+        "page after (19,)",
+        "page after None",
+        "page after (19,)",
+    ]
+    assert len([event for event in events if event.startswith("count")]) == 1
+    assert pager.page == 2
+
+
+def test_next_on_last_page_finishes(monkeypatch: pytest.MonkeyPatch) -> None:
+    output = io.StringIO()
+    pager = make_pager(ROWS, [], output)
+    feed(monkeypatch, ["3", ""])
+    pager.browse()
+    assert pager.page == 3
+    assert not pager.has_next
+    assert "Вакансия 44" in output.getvalue()
+
+
+def test_jump_beyond_last_page_shows_last_page(monkeypatch: pytest.MonkeyPatch) -> None:
+    output = io.StringIO()
+    pager = make_pager(ROWS, [], output)
+    feed(monkeypatch, ["99", "q"])
+    pager.browse()
+    assert pager.page == 3
+    assert pager.pages == 3
+
+
+def test_exact_multiple_of_page_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    events: List[str] = []
+    pager = make_pager(ROWS[:40], events, io.StringIO())
+    feed(monkeypatch, ["n", "n"])
+    pager.browse()
+    assert pager.page == 2
+    assert not pager.has_next
+
+
+def test_empty_result_skips_count() -> None:
+    events: List[str] = []
+    output = io.StringIO()
+    pager = make_pager([], events, output)
+    pager.browse()
+    assert events == ["page after None"]
+    assert "Ничего не найдено" in output.getvalue()
+
+
+def test_interrupt_stops_browsing(monkeypatch: pytest.MonkeyPatch) -> None:
+    def interrupt(prompt: str = "") -> str:
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr("builtins.input", interrupt)
+    pager = make_pager(ROWS, [], io.StringIO())
+    pager.browse()
+    assert pager.page == 1
+
+
+def test_from_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    output = io.StringIO()
+    pager = ResultPager.from_rows(ROWS, lambda row: row[1])
+    pager.output = output
+    feed(monkeypatch, ["n", "n", "n"])
+    pager.browse()
+    lines = [line for line in output.getvalue().splitlines() if line.startswith("Вакансия")]
+    assert lines == [row[1] for row in ROWS]
+    assert pager.total == len(ROWS)
@@ -0,0 +1,143 @@
+import random
+from array import array
+from pathlib import Path
+from typing import List, Set, Tuple
+
+import pytest
+
+from src.models import Employer, Vacancy
+from src.search_index import CACHE_SIZE, VacancySearchIndex, grams, intersect, stem, tokenize, union
+from src.snapshot import TABLES, SnapshotReader, SnapshotWriter
+from src.utils import collation_key
+
+WORDS = ["Python", "python-разработчик", "Java", "JavaScript", "аналитик", "Аналитики", "данных", "DevOps", "ии", "1С"]
+CITIES = ["Москва", "Санкт-Петербург", "Казань", None]
+
+
+def make_rows(count: int, seed: int = 7) -> List[Tuple]:
+    """Генерирует строки (source, vac_id, title, salary_from, salary_to, city, url, emp_id, компания)."""
+    rnd = random.Random(seed)
+    rows = []
+    for vac_id in range(1, count + 1):
+        title = " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(1, 3)))
+        source = rnd.choice(["hh", "fixture"])
+        city, url = rnd.choice(CITIES), f"https://{source}/{vac_id}"
+        rows.append((source, vac_id, title, None, None, city, url, vac_id % 5, f"Компания {vac_id % 5}"))
+    return rows
+
+
+def substring_match(rows: List[Tuple], keywords: List[str]) -> List[Tuple]:
+    """Эталон: поиск подстроки без учета регистра, как ILIKE '%keyword%'."""
+    lowered = [keyword.lower() for keyword in keywords]
+    found = [row for row in rows if any(keyword in row[2].lower() for keyword in lowered)]
+    found.sort(key=lambda row: (collation_key(row[2]), (row[0], row[1])))
+    return [(row[8], row[2], row[3], row[4], row[6]) for row in found]
+
+
+@pytest.fixture(scope="module")
+def rows() -> List[Tuple]:
+    return make_rows(500)
+
+
+@pytest.fixture
+def index(rows: List[Tuple]) -> VacancySearchIndex:
+    return VacancySearchIndex.from_rows(rows)
+
+
+@pytest.mark.parametrize(
+    "keywords",
+    [["python"], ["PY"], ["a"], ["ии"], ["аналитик"], ["script", "1с"], ["-раз"], ["devops", "данных"], ["нет"]],
+)
+def test_keyword_search_equals_substring_match(
+    index: VacancySearchIndex, rows: List[Tuple], keywords: List[str]
+) -> None:
+    assert index.get_vacancies_with_keyword(keywords) == substring_match(rows, keywords)
+
+
+def test_keyword_search_every_substring_of_vocabulary(index: VacancySearchIndex, rows: List[Tuple]) -> None:
+    keywords: Set[str] = set()
+    for word in WORDS:
+        for length in range(1, len(word) + 1):
+            keywords |= grams(word.lower(), length)
+    for keyword in sorted(keywords):
+        assert index.get_vacancies_with_keyword([keyword]) == substring_match(rows, [keyword])
+
+
+def test_cache_is_bounded_and_reset_by_new_vacancies() -> None:
+    index = VacancySearchIndex([Employer(1, "Компания", 1, "https://hh.ru/employer/1")])
+    index.add_vacancies([Vacancy(1, "Python-разработчик", None, None, 1, "Москва", "https://hh.ru/vacancy/1")])
+    first = index.get_vacancies_with_keyword(["python"])
+    assert index.get_vacancies_with_keyword(["PYTHON"]) is first
+    for number in range(CACHE_SIZE):
+        index.get_vacancies_with_keyword([f"ключ{number}"])
+    assert index.get_vacancies_with_keyword(["python"]) is not first
+
+    index.add_vacancies([Vacancy(2, "Senior Python", None, None, 1, "Казань", "https://hh.ru/vacancy/2")])
+    assert [row[1] for row in index.get_vacancies_with_keyword(["python"])] == ["Python-разработчик", "Senior Python"]
+
+
+def test_add_vacancies_to_index_built_from_rows() -> None:
+    index = VacancySearchIndex.from_rows([("hh", 1, "Python dev", None, None, "Москва", "u", 1, "Яндекс")])
+    added = index.add_vacancies(
+        [
+            Vacancy(2, "Python senior", None, None, 1, "Москва", "u2"),
+            Vacancy(3, "Python lead", None, None, 2, "Москва", "u3"),
+            Vacancy(4, "Python junior", None, None, 1, "Москва", "u4", source="fixture"),
+        ]
+    )
+    assert added == 1
+    assert len(index) == 2
+    assert index.get_vacancies_with_keyword(["senior"]) == [("Яндекс", "Python senior", 0, 0, "u2")]
+
+    index.add_employers([Employer(2, "VK", 1, "https://hh.ru/employer/2")])
+    assert index.add_vacancies([Vacancy(3, "Python lead", None, None, 2, "Москва", "u3")]) == 1
+
+
+def test_add_vacancies_to_index_built_from_snapshot(tmp_path: Path) -> None:
+    path = str(tmp_path / "vacancies.dbvs")
+    with SnapshotWriter(path) as writer:
+        writer.write_table("employers", TABLES["employers"], [[("hh", 1, "Яндекс", 1, "u"), ("hh", 2, "VK", 0, "u")]])
+        writer.write_table("vacancies", TABLES["vacancies"], [[("hh", 1, "Python dev", None, None, None, "u", 1)]])
+    with SnapshotReader(path) as reader:
+        index = VacancySearchIndex.from_snapshot(reader)
+    assert index.add_vacancies([Vacancy(2, "Python lead", None, None, 2, "Москва", "u2")]) == 1
+    assert [row[0] for row in index.get_vacancies_with_keyword(["python"])] == ["Яндекс", "VK"]
+
+
+def test_add_vacancies_skips_duplicates_and_unknown_employers() -> None:
+    index = VacancySearchIndex([Employer(1, "Компания", 1, "https://hh.ru/employer/1")])
+    vacancy = Vacancy(1, "Python-разработчик", None, None, 1, "Москва", "https://hh.ru/vacancy/1")
+    other_source = Vacancy(1, "Python-разработчик", None, None, 1, "Москва", "https://x/1", source="fixture")
+    assert index.add_vacancies([vacancy, vacancy, other_source]) == 1
+    assert len(index) == 1
+
+
+def test_search(index: VacancySearchIndex, rows: List[Tuple]) -> None:
+    found = index.search("аналитики москва")
+    expected = [
+        row for row in rows if stem("аналитики") in tokenize(row[2]) and stem("москва") in tokenize(row[5] or "")
+    ]
+    assert [row[4] for row in found] == [
+        row[6] for row in sorted(expected, key=lambda row: (collation_key(row[2]), (row[0], row[1])))
+    ]
+    assert len(index.search("аналитики москва", match_all=False)) >= len(found)
+    assert index.search("!!!") == []
+
+
+def test_intersect() -> None:
+    postings = [array("I", [1, 3, 5, 7, 9]), array("I", [3, 4, 5, 9]), array("I", [0, 3, 9, 10])]
+    assert intersect(postings) == [3, 9]
+    assert intersect([array("I", [1, 2]), array("I")]) == []
+    assert intersect([]) == []
+
+
+def test_union() -> None:
+    postings = [array("I", [1, 3, 5]), array("I", [3, 4]), array("I", [0, 5, 10])]
+    assert union(postings) == [0, 1, 3, 4, 5, 10]
+    assert union([]) == []
+
+
+def test_stem() -> None:
+    assert stem("аналитики") == stem("аналитик") == "аналитик"
+    assert stem("developers") == "develop"
+    assert stem("ии") == "ии"
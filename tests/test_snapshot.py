@@ -0,0 +1,102 @@
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from src.snapshot import TABLES, SnapshotReader, SnapshotWriter
+
+EMPLOYERS = [
+    ("hh", 1, "Яндекс", 2, "https://hh.ru/employer/1"),
+    ("hh", 2, "альфа-банк", 1, None),
+    ("fixture", 1, "Тестовая компания 1", 2, "https://fixture.local/employer/1"),
+]
+VACANCIES = [
+    ("hh", 10, "Python-разработчик", 150000, 200000, "Москва", "https://hh.ru/vacancy/10", 1),
+    ("hh", 11, "аналитик данных", None, 90000, None, "https://hh.ru/vacancy/11", 1),
+    ("hh", 12, "Инженер по тестированию", None, None, "Казань", "https://hh.ru/vacancy/12", 2),
+    ("fixture", 10, "Java-разработчик", 60000, None, "Москва", "https://fixture.local/vacancy/10", 1),
+    ("fixture", 11, "DevOps-инженер", 300000, 400000, "", "https://fixture.local/vacancy/11", 1),
+    ("fixture", 12, "Сирота без компании", 100000, None, None, "https://fixture.local/vacancy/12", 99),
+]
+
+
+def write_snapshot(path: Path, compress: bool, batch_size: int = 2) -> None:
+    """Записывает тестовые таблицы в снимок пачками по `batch_size` строк."""
+    with SnapshotWriter(str(path), compress=compress) as writer:
+        for table, rows in (("employers", EMPLOYERS), ("vacancies", VACANCIES)):
+            batches = [rows[start : start + batch_size] for start in range(0, len(rows), batch_size)]
+            writer.write_table(table, TABLES[table], batches)
+
+
+@pytest.fixture(params=[True, False], ids=["zlib", "none"])
+def reader(request: pytest.FixtureRequest, tmp_path: Path) -> SnapshotReader:
+    path = tmp_path / "vacancies.dbvs"
+    write_snapshot(path, compress=request.param)
+    snapshot = SnapshotReader(str(path))
+    request.addfinalizer(snapshot.close)
+    return snapshot
+
+
+def test_round_trip(reader: SnapshotReader) -> None:
+    assert list(reader.iter_rows("employers")) == EMPLOYERS
+    assert list(reader.iter_rows("vacancies")) == VACANCIES
+    assert reader.count_rows("vacancies") == len(VACANCIES)
+
+
+def test_iter_rows_selected_columns(reader: SnapshotReader) -> None:
+    assert list(reader.iter_rows("vacancies", ["salary_to", "vac_id"])) == [(row[4], row[1]) for row in VACANCIES]
+
+
+def test_avg_salary(reader: SnapshotReader) -> None:
+    assert reader.get_avg_salary() == round((175000 + 90000 + 60000 + 350000 + 100000) / 5, 2)
+
+
+def test_companies_and_vacancies_count(reader: SnapshotReader) -> None:
+    assert reader.get_companies_and_vacancies_count() == [
+        ("альфа-банк", 1),
+        ("Яндекс", 2),
+        ("Тестовая компания 1", 2),
+    ]
+
+
+def test_all_vacancies_skip_unknown_employers(reader: SnapshotReader) -> None:
+    names = [row[0] for row in reader.get_all_vacancies()]
+    assert names == ["альфа-банк", "Тестовая компания 1", "Тестовая компания 1", "Яндекс", "Яндекс"]
+
+
+def test_vacancies_with_keyword(reader: SnapshotReader) -> None:
+    titles: List[str] = [row[1] for row in reader.get_vacancies_with_keyword(["РАЗРАБ", "данных"])]
+    assert titles == ["Java-разработчик", "Python-разработчик", "аналитик данных"]
+
+
+def test_vacancies_with_higher_salary(reader: SnapshotReader) -> None:
+    rows: List[Tuple] = reader.get_vacancies_with_higher_salary()
+    assert [row[1] for row in rows] == ["DevOps-инженер", "Python-разработчик"]
+
+
+def test_close_with_unfinished_iterator(tmp_path: Path) -> None:
+    path = tmp_path / "vacancies.dbvs"
+    write_snapshot(path, compress=False)
+    snapshot = SnapshotReader(str(path))
+    rows = snapshot.iter_rows("vacancies")
+    next(rows)
+    snapshot.close()
+
+
+def test_failed_write_keeps_previous_snapshot(tmp_path: Path) -> None:
+    path = tmp_path / "vacancies.dbvs"
+    write_snapshot(path, compress=True)
+    with pytest.raises(RuntimeError):
+        with SnapshotWriter(str(path)) as writer:
+            writer.write_table("employers", TABLES["employers"], [EMPLOYERS])
+            raise RuntimeError("export failed")
+    with SnapshotReader(str(path)) as snapshot:
+        assert list(snapshot.iter_rows("vacancies")) == VACANCIES
+    assert not Path(f"{path}.tmp").exists()
+
+
+def test_invalid_file(tmp_path: Path) -> None:
+    path = tmp_path / "broken.dbvs"
+    path.write_bytes(b"not a snapshot at all, definitely")
+    with pytest.raises(ValueError):
+        SnapshotReader(str(path))
@@ -0,0 +1,111 @@
+import time
+from typing import Dict, Iterator, List
+
+import pytest
+import requests
+
+from src.external_api import HeadHunterAPI
+from src.fixture_api import FixtureAPI, FixtureServer
+from src.sources import SOURCE_PLUGINS, RateLimiter, SourceRegistry, register_source_plugin
+
+
+@pytest.fixture(scope="module")
+def server() -> Iterator[FixtureServer]:
+    with FixtureServer(employers=5, vacancies_per_employer=30, latency=0) as fixture_server:
+        yield fixture_server
+
+
+def test_fetch_from_fixture_server(server: FixtureServer) -> None:
+    with SourceRegistry() as registry:
+        registry.register(FixtureAPI(server.url, per_page=7), concurrency=4)
+        employers, vacancies, stats = registry.fetch()
+    assert len(employers) == 5
+    assert len(vacancies) == 150
+    assert {vac.source for vac in vacancies} == {"fixture"}
+    assert len({vac.uid for vac in vacancies}) == 150
+    assert {vac.emp_id for vac in vacancies} == {emp.emp_id for emp in employers}
+    assert stats["fixture"]["vacancies"] == stats["total"]["vacancies"] == 150
+
+
+def test_same_ids_from_different_sources_do_not_collide(server: FixtureServer) -> None:
+    class MirrorAPI(FixtureAPI):
+        source = "mirror"
+
+    with SourceRegistry() as registry:
+        registry.register(FixtureAPI(server.url), concurrency=2)
+        registry.register(MirrorAPI(server.url), concurrency=2)
+        _, vacancies, stats = registry.fetch()
+    assert registry.sources == ["fixture", "mirror"]
+    assert len({vac.vac_id for vac in vacancies}) == 150
+    assert len({vac.uid for vac in vacancies}) == 300
+    assert stats["total"]["vacancies"] == 300
+
+
+def test_failing_employer_does_not_discard_source(server: FixtureServer) -> None:
+    class FlakyAPI(FixtureAPI):
+        def get_employers(self) -> List[Dict]:
+            return super().get_employers() + [{"name": "Без ID"}]
+
+        def get_vacancies(self, employer_id: int) -> List[Dict]:
+            if employer_id == 3:
+                raise ValueError("malformed page")
+            return super().get_vacancies(employer_id)
+
+    with SourceRegistry() as registry:
+        registry.register(FlakyAPI(server.url), concurrency=4)
+        _, vacancies, stats = registry.fetch()
+    assert len(vacancies) == 120
+    assert 3 not in {vac.emp_id for vac in vacancies}
+    assert stats["fixture"]["vacancies"] == 120
+
+
+def test_unavailable_source_returns_no_data() -> None:
+    with FixtureServer(latency=0) as stopped:
+        url = stopped.url
+    with SourceRegistry() as registry:
+        registry.register(FixtureAPI(url), concurrency=2)
+        employers, vacancies, stats = registry.fetch()
+    assert employers == [] and vacancies == []
+    assert stats["fixture"]["vacancies"] == 0
+
+
+def test_fixture_api_stops_own_server() -> None:
+    api = FixtureAPI()
+    assert api.get_employers()
+    api.close()
+    with pytest.raises(requests.exceptions.RequestException):
+        api._connect()
+
+
+def test_rate_limiter_paces_requests() -> None:
+    limiter = RateLimiter(rate=50, burst=2)
+    started = time.monotonic()
+    for _ in range(7):
+        limiter.acquire()
+    # Два запроса проходят сразу, остальные пять — с интервалом 1/50 с
+    assert time.monotonic() - started >= 5 / 50 * 0.9
+
+
+def test_register_sets_rate_limiter(server: FixtureServer) -> None:
+    registry = SourceRegistry()
+    limited, unlimited = FixtureAPI(server.url), HeadHunterAPI()
+    registry.register(limited, concurrency=3, rate_limit=10)
+    registry.register(unlimited, rate_limit=0)
+    assert limited.rate_limiter is not None and limited.rate_limiter.burst == 3
+    assert unlimited.rate_limiter is None
+
+
+def test_from_settings_skips_disabled_and_unknown_sources() -> None:
+    registry = SourceRegistry.from_settings(
+        {"hh": {"enabled": False}, "unknown": {"enabled": True}, "fixture": {"enabled": True}}
+    )
+    assert registry.sources == []
+    assert "fixture" not in SOURCE_PLUGINS
+
+
+def test_register_source_plugin_requires_source_code() -> None:
+    class NamelessAPI(HeadHunterAPI):
+        source = ""
+
+    with pytest.raises(ValueError):
+        register_source_plugin(NamelessAPI)